@@ -1,12 +1,34 @@
 from django.contrib import admin
+from django.db.models import F
 from cars.models import Car, CarImage, CarSpecification
 
 
+class ChangelistOnlyMixin:
+    """Load only the columns rendered on the changelist page."""
+    
+    # Columns to load on the changelist; defaults to list_display
+    changelist_only_fields = None
+    
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        changelist = f'{self.opts.app_label}_{self.opts.model_name}_changelist'
+        if match and match.url_name == changelist:
+            return self.get_changelist_queryset(queryset)
+        return queryset
+    
+    def get_changelist_queryset(self, queryset):
+        """Restrict the changelist queryset to the displayed columns."""
+        return queryset.only('id', *(self.changelist_only_fields or self.list_display))
+
+
 @admin.register(Car)
-class CarAdmin(admin.ModelAdmin):
-    list_display = ['make', 'model', 'year', 'price', 'seller', 'status', 'created_at']
+class CarAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
+    list_display = ['make', 'model', 'year', 'price', 'seller_email', 'status', 'created_at']
+    changelist_only_fields = ['make', 'model', 'year', 'price', 'status', 'created_at']
     list_filter = ['status', 'condition', 'fuel_type', 'transmission', 'created_at']
-    search_fields = ['make', 'model', 'title', 'seller__email']
+    search_fields = ['make', 'model', 'title']
+    autocomplete_fields = ['seller']
     readonly_fields = ['id', 'created_at', 'updated_at', 'sold_at']
     fieldsets = (
         ('Basic Information', {
@@ -28,18 +50,30 @@ class CarAdmin(admin.ModelAdmin):
             'fields': ('created_at', 'updated_at', 'sold_at')
         }),
     )
+    
+    def get_changelist_queryset(self, queryset):
+        """Pull only the seller's email instead of joining the full user row."""
+        return super().get_changelist_queryset(queryset).annotate(seller_email=F('seller__email'))
+    
+    def seller_email(self, obj):
+        """Display the seller's email."""
+        return obj.seller_email
+    seller_email.short_description = 'Seller'
+    seller_email.admin_order_field = 'seller__email'
 
 
 @admin.register(CarImage)
-class CarImageAdmin(admin.ModelAdmin):
+class CarImageAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     list_display = ['car', 'is_primary', 'uploaded_at']
+    list_select_related = ['car']
     list_filter = ['is_primary', 'uploaded_at']
     search_fields = ['car__make', 'car__model']
     readonly_fields = ['id', 'uploaded_at']
 
 
 @admin.register(CarSpecification)
-class CarSpecificationAdmin(admin.ModelAdmin):
+class CarSpecificationAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     list_display = ['car', 'horsepower', 'torque', 'top_speed']
+    list_select_related = ['car']
     search_fields = ['car__make', 'car__model']
     readonly_fields = ['id', 'created_at', 'updated_at']
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CarsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'cars'
+
+    def ready(self):
+        import cars.signals
@@ -0,0 +1,24 @@
+from django.core.cache import cache
+
+
+DETAIL_CACHE_TIMEOUT = 3600
+
+
+def detail_version_key(car_id):
+    """Cache key holding the current detail version and visibility of a car."""
+    return f'car:v:{car_id}'
+
+
+def detail_key(car_id, version):
+    """Cache key holding the serialized detail payload for one car version."""
+    return f'car:{car_id}:v{version}'
+
+
+def invalidate_car_detail(car_id):
+    """Drop the cached detail version and payload of a car."""
+    version_key = detail_version_key(car_id)
+    state = cache.get(version_key)
+    keys = [version_key]
+    if state is not None:
+        keys.append(detail_key(car_id, state['version']))
+    cache.delete_many(keys)
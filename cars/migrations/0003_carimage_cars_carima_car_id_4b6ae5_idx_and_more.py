@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0002_alter_car_year'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='carimage',
+            index=models.Index(fields=['car', 'is_primary'], name='cars_carima_car_id_4b6ae5_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='carimage',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_primary', True)), fields=('car',), name='uniq_primary_image_per_car'),
+        ),
+    ]
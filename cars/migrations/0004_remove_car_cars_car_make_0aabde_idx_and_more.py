@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-16 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0003_carimage_cars_carima_car_id_4b6ae5_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='car',
+            name='cars_car_make_0aabde_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='car',
+            name='cars_car_city_60a4a5_idx',
+        ),
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(fields=['status', 'city', 'price'], name='cars_car_status_6cd60b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(fields=['status', 'make', 'model', 'year'], name='cars_car_status_c6cfc7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(fields=['status', '-created_at'], name='cars_car_status_310f53_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations
+
+
+def create_features_gin_index(apps, schema_editor):
+    # GIN only exists on PostgreSQL; other backends keep scanning features.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS car_features_gin ON cars_car USING gin (features)'
+    )
+
+
+def drop_features_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS car_features_gin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0004_remove_car_cars_car_make_0aabde_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_features_gin_index, drop_features_gin_index),
+    ]
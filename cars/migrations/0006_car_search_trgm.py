@@ -0,0 +1,34 @@
+from django.db import migrations
+
+# icontains compiles to UPPER("col"::text) LIKE UPPER(%s) on PostgreSQL, so the
+# trigram indexes are built over the same expression to be usable.
+TRGM_COLUMNS = ['title', 'make', 'model', 'description']
+
+
+def create_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in TRGM_COLUMNS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS car_{column}_trgm ON cars_car '
+            f'USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for column in TRGM_COLUMNS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS car_{column}_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0005_car_features_gin'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 6.0 on 2026-10-16 10:25
+
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0006_car_search_trgm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='car',
+            name='display_name',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=django.db.models.functions.text.Concat(django.db.models.functions.comparison.Cast('year', output_field=models.CharField()), models.Value(' '), 'make', models.Value(' '), 'model', models.Value(' - '), django.db.models.functions.comparison.Cast('price', output_field=models.CharField())), output_field=models.CharField(max_length=300)),
+        ),
+    ]
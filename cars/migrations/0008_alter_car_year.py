@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-16 10:41
+
+import cars.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0007_car_display_name'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='car',
+            name='year',
+            field=models.IntegerField(db_index=True, validators=[cars.models.validate_year]),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 6.0 on 2026-10-16 11:02
+
+from django.db import migrations, models
+from django.db.models import Count, Exists, OuterRef
+
+
+def backfill_counters(apps, schema_editor):
+    Car = apps.get_model('cars', 'Car')
+    CarSpecification = apps.get_model('cars', 'CarSpecification')
+    cars = Car.objects.annotate(
+        num_images=Count('images'),
+        has_spec=Exists(CarSpecification.objects.filter(car=OuterRef('pk')))
+    )
+    for car in cars.iterator():
+        Car.objects.filter(pk=car.pk).update(
+            image_count=car.num_images,
+            has_specification=car.has_spec
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0008_alter_car_year'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='car',
+            name='has_specification',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='car',
+            name='image_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+from django.db import migrations, models
+
+
+def create_created_at_brin(apps, schema_editor):
+    # BRIN only exists on PostgreSQL
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS car_created_brin ON cars_car '
+        'USING brin (created_at) WITH (pages_per_range = 32)'
+    )
+
+
+def drop_created_at_brin(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS car_created_brin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0010_alter_car_seller'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='car',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.RunPython(create_created_at_brin, drop_created_at_brin),
+    ]
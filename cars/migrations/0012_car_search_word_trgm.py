@@ -0,0 +1,48 @@
+from django.db import migrations
+
+# The search action matches with the %> word-similarity operator on the raw
+# columns; make/model keep their UPPER() indexes from 0006 for the per-field
+# icontains filters, and city gets one for its icontains filter.
+RAW_TRGM_COLUMNS = ['make', 'model', 'title', 'description']
+UNUSED_UPPER_TRGM_COLUMNS = ['title', 'description']
+
+
+def create_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in UNUSED_UPPER_TRGM_COLUMNS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS car_{column}_trgm')
+    for column in RAW_TRGM_COLUMNS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS car_{column}_word_trgm ON cars_car '
+            f'USING gin ({column} gin_trgm_ops)'
+        )
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS car_city_trgm ON cars_car '
+        'USING gin (UPPER(city::text) gin_trgm_ops)'
+    )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS car_city_trgm')
+    for column in RAW_TRGM_COLUMNS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS car_{column}_word_trgm')
+    for column in UNUSED_UPPER_TRGM_COLUMNS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS car_{column}_trgm ON cars_car '
+            f'USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0011_alter_car_created_at_brin'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
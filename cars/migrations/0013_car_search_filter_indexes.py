@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-16 12:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0012_car_search_word_trgm'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='car',
+            name='cars_car_seller__4cf064_idx',
+        ),
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(fields=['seller', 'status', '-created_at'], name='cars_car_seller__6a7a7c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(fields=['status', 'condition', 'price'], name='cars_car_status_8f9d75_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(fields=['status', 'fuel_type', 'transmission'], name='cars_car_status_29496d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['-created_at'], name='car_active_created_idx'),
+        ),
+    ]
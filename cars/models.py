@@ -1,8 +1,75 @@
-from django.db import models
-from django.core.validators import MinValueValidator, MaxValueValidator
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models.functions import Cast, Concat
+from django.core.exceptions import ValidationError
+from django.core.validators import MinValueValidator
 from django.utils import timezone
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import uuid
-from users.models import CustomUser
+from cars.cache import invalidate_car_detail
+from users.models import CustomUser, USER_LIST_COLUMNS
+
+
+@lru_cache(maxsize=None)
+def get_upload_executor():
+    """Return the process-wide thread pool used for image storage uploads."""
+    return ThreadPoolExecutor(
+        max_workers=getattr(settings, 'CAR_IMAGE_UPLOAD_WORKERS', 8),
+        thread_name_prefix='car-image-upload'
+    )
+
+
+def validate_year(value):
+    """Validate a model year against the current year at validation time."""
+    max_year = timezone.now().year + 1
+    if not 1900 <= value <= max_year:
+        raise ValidationError(
+            f'Year must be between 1900 and {max_year}.',
+            code='invalid_year'
+        )
+
+
+class CarQuerySet(models.QuerySet):
+    """QuerySet helpers for loading cars with their related rows."""
+    
+    LIST_FIELDS = (
+        'id', 'make', 'model', 'year', 'price', 'condition', 'city',
+        'status', 'created_at', 'mileage', 'image_count'
+    )
+    
+    def with_related(self):
+        """
+        Join the seller and annotate the primary image path for list views.
+        
+        Only the list columns are loaded, leaving description, features and
+        the other wide columns deferred.
+        """
+        # Primary-first ordering falls back to the oldest upload
+        primary_image = CarImage.objects.filter(
+            car=models.OuterRef('pk')
+        ).order_by('-is_primary', 'uploaded_at')
+        seller_fields = [f'seller__{name}' for name in USER_LIST_COLUMNS]
+        return self.select_related('seller').only(
+            *self.LIST_FIELDS, 'seller', *seller_fields
+        ).annotate(
+            primary_image_path=models.Subquery(primary_image.values('image')[:1])
+        )
+    
+    def list_values(self):
+        """
+        Return list-view rows as dicts with the seller and primary image path.
+        
+        Skips model instantiation; rows are rendered by CarListSerializer.
+        """
+        seller_fields = [f'seller__{name}' for name in USER_LIST_COLUMNS]
+        return self.with_related().values(
+            *self.LIST_FIELDS, *seller_fields, 'primary_image_path'
+        )
+    
+    def with_details(self):
+        """Join the seller and specification and prefetch all images."""
+        return self.select_related('seller', 'specification').prefetch_related('images')
 
 
 class Car(models.Model):
@@ -38,20 +105,23 @@ class Car(models.Model):
         ('pending', 'Pending Review'),
     )
     
+    # Valid stored values per choice field, checked in clean_fields()
+    CHOICE_VALUES = {
+        'condition': frozenset(value for value, _ in CONDITION_CHOICES),
+        'transmission': frozenset(value for value, _ in TRANSMISSION_CHOICES),
+        'fuel_type': frozenset(value for value, _ in FUEL_TYPE_CHOICES),
+        'status': frozenset(value for value, _ in STATUS_CHOICES),
+    }
+    
     # Primary fields
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    seller = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='cars_for_sale')
+    # Indexed via the (seller, status) composite below
+    seller = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='cars_for_sale', db_index=False)
     
     # Basic information
     make = models.CharField(max_length=100, db_index=True)  # e.g., Toyota
     model = models.CharField(max_length=100, db_index=True)  # e.g., Camry
-    year = models.IntegerField(
-        validators=[
-            MinValueValidator(1900),
-            MaxValueValidator(timezone.now().year + 1)
-        ],
-        db_index=True
-    )
+    year = models.IntegerField(validators=[validate_year], db_index=True)
     
     # Specifications
     mileage = models.IntegerField(
@@ -95,7 +165,9 @@ class Car(models.Model):
     is_featured = models.BooleanField(default=False)
     
     # Timestamps
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    # On PostgreSQL created_at gets a BRIN index (migration 0011); filtered
+    # browsing uses the (status, -created_at) composite.
+    created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     sold_at = models.DateTimeField(null=True, blank=True)
     
@@ -112,27 +184,100 @@ class Car(models.Model):
         help_text="List of features: ['AC', 'Power Steering', 'ABS', etc.]"
     )
     
+    # Denormalized counters maintained by cars.signals
+    image_count = models.PositiveIntegerField(default=0)
+    has_specification = models.BooleanField(default=False)
+    
+    # Database-computed label so bulk listings don't format __str__ in Python
+    display_name = models.GeneratedField(
+        expression=Concat(
+            Cast('year', output_field=models.CharField()), models.Value(' '),
+            'make', models.Value(' '), 'model', models.Value(' - '),
+            Cast('price', output_field=models.CharField())
+        ),
+        output_field=models.CharField(max_length=300),
+        db_persist=True,
+        db_index=True
+    )
+    
+    objects = CarQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['seller', 'status']),
-            models.Index(fields=['make', 'model', 'year']),
+            models.Index(fields=['seller', 'status', '-created_at']),
             models.Index(fields=['price']),
-            models.Index(fields=['city']),
+            # Browse/search filters always lead with status; the composites
+            # also cover make/model/year and city lookups by prefix.
+            models.Index(fields=['status', 'city', 'price']),
+            models.Index(fields=['status', 'make', 'model', 'year']),
+            models.Index(fields=['status', 'condition', 'price']),
+            models.Index(fields=['status', 'fuel_type', 'transmission']),
+            models.Index(fields=['status', '-created_at']),
+            # Public listings are almost always status='active'
+            models.Index(
+                fields=['-created_at'],
+                condition=models.Q(status='active'),
+                name='car_active_created_idx'
+            ),
         ]
     
     def __str__(self):
+        # Generated values are only present once loaded from the database
+        display_name = self.__dict__.get('display_name')
+        if display_name:
+            return display_name
         return f"{self.year} {self.make} {self.model} - {self.price}"
     
-    def mark_as_sold(self):
-        """Mark car as sold."""
+    def clean_fields(self, exclude=None):
+        """Check choice fields with set lookups before the generic validation."""
+        exclude = set(exclude or ())
+        errors = {}
+        for name, allowed in self.CHOICE_VALUES.items():
+            if name in exclude:
+                continue
+            exclude.add(name)
+            value = getattr(self, name)
+            if value not in allowed:
+                field = self._meta.get_field(name)
+                errors[name] = [ValidationError(
+                    field.error_messages['invalid_choice'],
+                    code='invalid_choice',
+                    params={'value': value}
+                )]
+        try:
+            super().clean_fields(exclude=exclude)
+        except ValidationError as e:
+            errors = e.update_error_dict(errors)
+        if errors:
+            raise ValidationError(errors)
+    
+    def mark_as_sold(self, send_signals=False):
+        """
+        Mark car as sold.
+        
+        Writes only the status columns with a queryset update; pass
+        send_signals=True to go through a full save() instead. Either way the
+        cached detail is dropped. Cars that are already sold are left untouched.
+        """
+        if self.status == 'sold':
+            return
+        now = timezone.now()
         self.status = 'sold'
-        self.sold_at = timezone.now()
-        self.save()
+        self.sold_at = now
+        if send_signals:
+            self.save()
+            return
+        Car.objects.filter(pk=self.pk).update(status='sold', sold_at=now, updated_at=now)
+        self.updated_at = now
+        # update() sends no post_save, so the detail cache is not cleared for us
+        invalidate_car_detail(self.pk)
     
     def get_primary_image(self):
         """Get the primary image for the car."""
-        return self.images.filter(is_primary=True).first() or self.images.first()
+        # Images are ordered primary-first, so the first one is the primary
+        # image (or the oldest upload when none is flagged).
+        return self.images.first()
 
 
 class CarImage(models.Model):
@@ -147,15 +292,86 @@ class CarImage(models.Model):
     
     class Meta:
         ordering = ['-is_primary', 'uploaded_at']
+        indexes = [
+            models.Index(fields=['car', 'is_primary']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['car'],
+                condition=models.Q(is_primary=True),
+                name='uniq_primary_image_per_car'
+            ),
+        ]
     
     def __str__(self):
         return f"Image for {self.car}"
     
+    # is_primary as last loaded from/saved to the database
+    _saved_is_primary = False
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if 'is_primary' in field_names:
+            instance._saved_is_primary = instance.is_primary
+        return instance
+    
     def save(self, *args, **kwargs):
         """Ensure only one primary image per car."""
-        if self.is_primary:
-            CarImage.objects.filter(car=self.car, is_primary=True).exclude(id=self.id).update(is_primary=False)
+        # Only demote siblings when this image is being promoted
+        if self.is_primary and not self._saved_is_primary:
+            CarImage.objects.filter(car_id=self.car_id, is_primary=True).exclude(id=self.id).update(is_primary=False)
         super().save(*args, **kwargs)
+        self._saved_is_primary = self.is_primary
+    
+    @classmethod
+    def set_primary(cls, car_id, image_id):
+        """Make an image the car's primary image without a full model save."""
+        with transaction.atomic():
+            cls.objects.filter(car_id=car_id, is_primary=True).exclude(id=image_id).update(is_primary=False)
+            return cls.objects.filter(id=image_id, car_id=car_id).update(is_primary=True)
+    
+    @classmethod
+    def store_files(cls, car, files):
+        """
+        Upload image files to storage concurrently.
+        
+        Uses a shared pool so requests don't spawn their own threads; a single
+        file is stored inline. Returns the stored names in input order; plain
+        strings are treated as names that are already stored.
+        """
+        field = cls._meta.get_field('image')
+        
+        def store(file):
+            if isinstance(file, str):
+                return file
+            name = field.generate_filename(cls(car=car), file.name)
+            return field.storage.save(name, file, max_length=field.max_length)
+        
+        if len(files) <= 1:
+            return [store(file) for file in files]
+        return list(get_upload_executor().map(store, files))
+    
+    @classmethod
+    def bulk_ingest(cls, car, images, primary_index=None):
+        """
+        Create several images for a car with a single INSERT.
+        
+        Files are uploaded to storage up front (see store_files), then
+        bulk_create skips save() and signals, so the car's image count is
+        bumped here. Optionally promotes images[primary_index] to primary.
+        """
+        names = cls.store_files(car, images)
+        with transaction.atomic():
+            created = cls.objects.bulk_create(
+                [cls(car=car, image=name) for name in names],
+                batch_size=100
+            )
+            Car.objects.filter(pk=car.pk).update(image_count=models.F('image_count') + len(created))
+            if primary_index is not None:
+                cls.set_primary(car.pk, created[primary_index].pk)
+                created[primary_index].is_primary = True
+        return created
 
 
 class CarSpecification(models.Model):
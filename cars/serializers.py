@@ -1,6 +1,6 @@
 from rest_framework import serializers
 from cars.models import Car, CarImage, CarSpecification
-from users.api.serializers import UserListSerializer
+from users.api.serializers import UserListRowSerializer, UserListSerializer
 
 
 class CarImageSerializer(serializers.ModelSerializer):
@@ -26,26 +26,48 @@ class CarSpecificationSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
-class CarListSerializer(serializers.ModelSerializer):
-    """Serializer for car list view."""
+class CarListSerializer(serializers.Serializer):
+    """
+    Read-only serializer for car list views.
     
-    seller = UserListSerializer(read_only=True)
-    primary_image = serializers.SerializerMethodField()
+    Renders the dict rows of CarQuerySet.list_values directly, so list
+    endpoints never build model instances or walk ModelSerializer fields.
+    The seller is rendered by UserListRowSerializer.
+    """
     
-    class Meta:
-        model = Car
-        fields = [
-            'id', 'seller', 'make', 'model', 'year', 'price', 'condition',
-            'city', 'status', 'created_at', 'primary_image', 'mileage'
-        ]
-        read_only_fields = ['id', 'created_at', 'status']
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Built once and reused for every row
+        self.price_field = serializers.DecimalField(max_digits=12, decimal_places=2)
+        self.datetime_field = serializers.DateTimeField()
+        self.image_storage = CarImage._meta.get_field('image').storage
+        self.seller_serializer = UserListRowSerializer(prefix='seller__')
+        self.seller_serializer.bind('seller', self)
+    
+    def get_file_url(self, storage, name):
+        """Build a file URL the way DRF's ImageField does."""
+        if not name:
+            return None
+        url = storage.url(name)
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
     
-    def get_primary_image(self, obj):
-        """Get primary image URL."""
-        image = obj.get_primary_image()
-        if image:
-            return CarImageSerializer(image).data
-        return None
+    def to_representation(self, row):
+        return {
+            'id': str(row['id']),
+            'seller': self.seller_serializer.to_representation(row),
+            'make': row['make'],
+            'model': row['model'],
+            'year': row['year'],
+            'price': self.price_field.to_representation(row['price']),
+            'condition': row['condition'],
+            'city': row['city'],
+            'status': row['status'],
+            'created_at': self.datetime_field.to_representation(row['created_at']),
+            'primary_image_url': self.get_file_url(self.image_storage, row['primary_image_path']),
+            'mileage': row['mileage'],
+            'image_count': row['image_count'],
+        }
 
 
 class CarDetailSerializer(serializers.ModelSerializer):
@@ -65,6 +87,22 @@ class CarDetailSerializer(serializers.ModelSerializer):
             'images', 'specification', 'created_at', 'updated_at', 'sold_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'sold_at', 'status']
+    
+    @staticmethod
+    def with_absolute_urls(data, request):
+        """
+        Make the file URLs of a payload rendered without a request absolute
+        for this one, the way DRF's ImageField would have built them.
+        """
+        def absolute(url):
+            return request.build_absolute_uri(url) if url else url
+        
+        seller = data['seller']
+        return {
+            **data,
+            'seller': {**seller, 'profile_picture': absolute(seller['profile_picture'])},
+            'images': [{**image, 'image': absolute(image['image'])} for image in data['images']],
+        }
 
 
 class CarCreateUpdateSerializer(serializers.ModelSerializer):
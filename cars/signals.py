@@ -0,0 +1,48 @@
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .cache import invalidate_car_detail
+from .models import Car, CarImage, CarSpecification
+
+
+@receiver(post_save, sender=Car)
+def invalidate_detail_on_save(sender, instance, created, **kwargs):
+    """Drop the cached detail payload when a car is saved."""
+    if not created:
+        invalidate_car_detail(instance.pk)
+
+
+@receiver(post_delete, sender=Car)
+def invalidate_detail_on_delete(sender, instance, **kwargs):
+    """Drop the cached detail payload when a car is deleted."""
+    invalidate_car_detail(instance.pk)
+
+
+@receiver(post_save, sender=CarImage)
+def update_image_count_on_save(sender, instance, created, **kwargs):
+    """Increment car image count on create and drop cached car details."""
+    if created:
+        Car.objects.filter(pk=instance.car_id).update(image_count=F('image_count') + 1)
+    invalidate_car_detail(instance.car_id)
+
+
+@receiver(post_delete, sender=CarImage)
+def update_image_count_on_delete(sender, instance, **kwargs):
+    """Decrement car image count and drop cached car details."""
+    Car.objects.filter(pk=instance.car_id, image_count__gt=0).update(image_count=F('image_count') - 1)
+    invalidate_car_detail(instance.car_id)
+
+
+@receiver(post_save, sender=CarSpecification)
+def update_has_specification_on_save(sender, instance, created, **kwargs):
+    """Flag the car as having a specification and drop cached car details."""
+    if created:
+        Car.objects.filter(pk=instance.car_id).update(has_specification=True)
+    invalidate_car_detail(instance.car_id)
+
+
+@receiver(post_delete, sender=CarSpecification)
+def update_has_specification_on_delete(sender, instance, **kwargs):
+    """Clear the car's specification flag and drop cached car details."""
+    Car.objects.filter(pk=instance.car_id).update(has_specification=False)
+    invalidate_car_detail(instance.car_id)
@@ -1,6 +1,11 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
-from cars.models import Car, CarImage, CarSpecification
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from cars.cache import detail_key, detail_version_key
+from cars.models import Car, CarImage, CarSpecification, validate_year
 from decimal import Decimal
 
 User = get_user_model()
@@ -63,6 +68,56 @@ class CarModelTest(TestCase):
         self.assertEqual(car.status, "pending")
         self.assertIsNotNone(car.created_at)
 
+    def test_validate_year_bounds(self):
+        """Test that year validation tracks the current year"""
+        next_year = timezone.now().year + 1
+        validate_year(1900)
+        validate_year(next_year)
+        with self.assertRaises(ValidationError):
+            validate_year(1899)
+        with self.assertRaises(ValidationError):
+            validate_year(next_year + 1)
+
+    def test_clean_fields_rejects_invalid_choice(self):
+        """Test that choice fields are validated against their choices"""
+        self.car.condition = "excellent"
+        self.car.clean_fields()
+
+        self.car.condition = "used"
+        self.car.fuel_type = "steam"
+        with self.assertRaises(ValidationError) as ctx:
+            self.car.clean_fields()
+        self.assertIn("condition", ctx.exception.message_dict)
+        self.assertIn("fuel_type", ctx.exception.message_dict)
+
+    def test_mark_as_sold(self):
+        """Test marking a car as sold updates the stored row"""
+        self.car.mark_as_sold()
+        self.assertEqual(self.car.status, "sold")
+
+        self.car.refresh_from_db()
+        self.assertEqual(self.car.status, "sold")
+        self.assertIsNotNone(self.car.sold_at)
+        self.assertEqual(self.car.updated_at, self.car.sold_at)
+
+    def test_mark_as_sold_is_idempotent(self):
+        """Test that marking a sold car again keeps the original sold_at"""
+        self.car.mark_as_sold()
+        sold_at = self.car.sold_at
+
+        with self.assertNumQueries(0):
+            self.car.mark_as_sold()
+        self.assertEqual(self.car.sold_at, sold_at)
+
+    def test_mark_as_sold_drops_cached_detail(self):
+        """Test that marking a car as sold invalidates the cached car detail"""
+        cache.set(detail_version_key(self.car.id), {'version': 1}, 60)
+        cache.set(detail_key(self.car.id, 1), {'id': str(self.car.id)}, 60)
+        self.car.mark_as_sold()
+
+        self.assertIsNone(cache.get(detail_version_key(self.car.id)))
+        self.assertIsNone(cache.get(detail_key(self.car.id, 1)))
+
     def test_car_status_choices(self):
         """Test that status can be set to different values"""
         self.car.status = "sold"
@@ -108,6 +163,93 @@ class CarImageModelTest(TestCase):
         
         self.assertEqual(self.car.images.count(), 3)
 
+    def test_get_primary_image(self):
+        """Test that the primary image is returned ahead of older uploads"""
+        CarImage.objects.create(car=self.car, is_primary=False)
+        primary = CarImage.objects.create(car=self.car, is_primary=True)
+
+        self.assertEqual(self.car.get_primary_image(), primary)
+
+    def test_primary_image_path_annotation(self):
+        """Test that list querysets carry the primary image path"""
+        CarImage.objects.create(car=self.car, image='cars/other.jpg', is_primary=False)
+        CarImage.objects.create(car=self.car, image='cars/primary.jpg', is_primary=True)
+
+        car = Car.objects.with_related().get(id=self.car.id)
+        self.assertEqual(car.primary_image_path, 'cars/primary.jpg')
+
+    def test_list_values_rows(self):
+        """Test that list rows carry seller columns and the primary image path"""
+        CarImage.objects.create(car=self.car, image='cars/primary.jpg', is_primary=True)
+
+        row = Car.objects.filter(id=self.car.id).list_values().get()
+        self.assertEqual(row['make'], "Toyota")
+        self.assertEqual(row['seller__email'], "seller@example.com")
+        self.assertEqual(row['primary_image_path'], 'cars/primary.jpg')
+
+    def test_promoting_image_demotes_previous_primary(self):
+        """Test that saving a new primary image demotes the old one"""
+        old_primary = CarImage.objects.create(car=self.car, is_primary=True)
+        image = CarImage.objects.create(car=self.car, is_primary=False)
+        image.is_primary = True
+        image.save()
+
+        old_primary.refresh_from_db()
+        self.assertFalse(old_primary.is_primary)
+        self.assertEqual(self.car.images.filter(is_primary=True).count(), 1)
+
+    def test_set_primary(self):
+        """Test promoting an image with the set_primary helper"""
+        old_primary = CarImage.objects.create(car=self.car, is_primary=True)
+        image = CarImage.objects.create(car=self.car, is_primary=False)
+
+        CarImage.set_primary(self.car.id, image.id)
+
+        old_primary.refresh_from_db()
+        image.refresh_from_db()
+        self.assertFalse(old_primary.is_primary)
+        self.assertTrue(image.is_primary)
+
+    def test_single_primary_enforced_by_database(self):
+        """Test that the database rejects a second primary image per car"""
+        CarImage.objects.create(car=self.car, is_primary=True)
+        image = CarImage.objects.create(car=self.car, is_primary=False)
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            CarImage.objects.filter(id=image.id).update(is_primary=True)
+
+    def test_image_count_tracks_images(self):
+        """Test that the denormalized image count follows creates and deletes"""
+        image = CarImage.objects.create(car=self.car)
+        CarImage.objects.create(car=self.car)
+        self.car.refresh_from_db()
+        self.assertEqual(self.car.image_count, 2)
+
+        image.delete()
+        self.car.refresh_from_db()
+        self.assertEqual(self.car.image_count, 1)
+
+    def test_bulk_ingest(self):
+        """Test creating several images at once with a chosen primary"""
+        old_primary = CarImage.objects.create(car=self.car, is_primary=True)
+        created = CarImage.bulk_ingest(self.car, ['a.jpg', 'b.jpg', 'c.jpg'], primary_index=1)
+
+        self.assertEqual(len(created), 3)
+        self.assertEqual(self.car.get_primary_image(), created[1])
+        old_primary.refresh_from_db()
+        self.assertFalse(old_primary.is_primary)
+        self.car.refresh_from_db()
+        self.assertEqual(self.car.image_count, 4)
+
+    def test_image_change_drops_cached_detail(self):
+        """Test that adding an image invalidates the cached car detail"""
+        cache.set(detail_version_key(self.car.id), {'version': 1}, 60)
+        cache.set(detail_key(self.car.id, 1), {'id': str(self.car.id)}, 60)
+        CarImage.objects.create(car=self.car)
+
+        self.assertIsNone(cache.get(detail_version_key(self.car.id)))
+        self.assertIsNone(cache.get(detail_key(self.car.id, 1)))
+
     def test_image_cascade_delete(self):
         """Test that images are deleted when car is deleted"""
         CarImage.objects.create(car=self.car)
@@ -152,6 +294,16 @@ class CarSpecificationModelTest(TestCase):
         self.assertEqual(spec.horsepower, 473)
         self.assertEqual(spec.top_speed, 290)
 
+    def test_has_specification_flag(self):
+        """Test that the car's specification flag follows its specification"""
+        spec = CarSpecification.objects.create(car=self.car, horsepower=400)
+        self.car.refresh_from_db()
+        self.assertTrue(self.car.has_specification)
+
+        spec.delete()
+        self.car.refresh_from_db()
+        self.assertFalse(self.car.has_specification)
+
     def test_specification_one_to_one(self):
         """Test that specification has one-to-one relationship with car"""
         CarSpecification.objects.create(
@@ -0,0 +1,7 @@
+from rest_framework.routers import SimpleRouter
+from cars.views import CarViewSet
+
+router = SimpleRouter()
+router.register(r'cars', CarViewSet, basename='car')
+
+urlpatterns = router.urls
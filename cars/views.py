@@ -1,14 +1,21 @@
 from rest_framework import viewsets, status, permissions, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
-from django.db.models import Q
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connection
+from django.db.models import F, Q
 from django.utils import timezone
+from cars.cache import (
+    DETAIL_CACHE_TIMEOUT, detail_key, detail_version_key, invalidate_car_detail
+)
 from cars.models import Car, CarImage, CarSpecification
 from cars.serializers import (
     CarListSerializer, CarDetailSerializer, CarCreateUpdateSerializer,
     CarImageSerializer, CarSearchSerializer
 )
+from mvpbackend.pagination import CachedCountPagination as BaseCachedCountPagination
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -18,13 +25,42 @@ class StandardResultsSetPagination(PageNumberPagination):
     max_page_size = 100
 
 
+class CachedCountPagination(StandardResultsSetPagination, BaseCachedCountPagination):
+    """Cached-count pagination sized like the other car listings."""
+    count_cache_prefix = 'carcount'
+
+
+class CarCursorPagination(CursorPagination):
+    """
+    Keyset pagination for car listings.
+    
+    Pages seek on the ordering column instead of using OFFSET, so deep pages
+    cost the same as the first one.
+    """
+    ordering = '-created_at'
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
 class IsOwnerOrReadOnly(permissions.BasePermission):
     """Permission to only allow owners to edit their cars."""
     
     def has_object_permission(self, request, view, obj):
         if request.method in permissions.SAFE_METHODS:
             return True
-        return obj.seller == request.user
+        return obj.seller_id == request.user.pk
+
+
+class IsOwnerOrStaff(permissions.BasePermission):
+    """Permission for car actions restricted to the seller or staff."""
+    message = 'You can only modify your own cars'
+    
+    def has_permission(self, request, view):
+        return request.user.is_authenticated
+    
+    def has_object_permission(self, request, view, obj):
+        return obj.seller_id == request.user.pk or request.user.is_staff
 
 
 class CarViewSet(viewsets.ModelViewSet):
@@ -43,11 +79,37 @@ class CarViewSet(viewsets.ModelViewSet):
     
     queryset = Car.objects.filter(status='active')
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsOwnerOrReadOnly]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = CarCursorPagination
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['make', 'model', 'title', 'description', 'city']
-    ordering_fields = ['price', 'created_at', 'year', 'mileage']
+    # Only indexed columns, so cursor pages can seek instead of sorting
+    ordering_fields = ['price', 'created_at', 'year']
     ordering = ['-created_at']
+    listing_actions = ('list', 'search', 'my_listings', 'seller_cars')
+    # Search query parameter -> ORM lookup, applied in one filter() call
+    SEARCH_FILTER_MAP = (
+        ('make', 'make__icontains'),
+        ('model', 'model__icontains'),
+        ('year_from', 'year__gte'),
+        ('year_to', 'year__lte'),
+        ('price_from', 'price__gte'),
+        ('price_to', 'price__lte'),
+        ('condition', 'condition'),
+        ('fuel_type', 'fuel_type'),
+        ('transmission', 'transmission'),
+        ('city', 'city__icontains'),
+        ('mileage_max', 'mileage__lte'),
+    )
+    
+    @property
+    def paginator(self):
+        """Use page numbers for search, whose results may be ranked by relevance."""
+        if not hasattr(self, '_paginator'):
+            if self.action == 'search':
+                self._paginator = CachedCountPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -61,15 +123,68 @@ class CarViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Filter queryset based on user and status."""
-        queryset = Car.objects.all()
+        user = self.request.user
         
-        # Non-staff users only see active cars or their own
-        if not self.request.user.is_staff:
-            queryset = queryset.filter(
-                Q(status='active') | Q(seller=self.request.user)
-            )
+        # Non-staff users only see active cars or their own; anonymous
+        # users skip the OR so the active-listing partial index applies.
+        if not user.is_authenticated:
+            queryset = Car.objects.filter(status='active')
+        elif user.is_staff:
+            queryset = Car.objects.all()
+        else:
+            queryset = Car.objects.filter(Q(status='active') | Q(seller=user))
         
-        return queryset.select_related('seller').prefetch_related('images')
+        if self.action == 'retrieve':
+            return queryset.with_details()
+        if self.action in self.listing_actions:
+            return queryset.list_values()
+        return queryset
+    
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Return car details, served from the cache when possible.
+        
+        Payloads are keyed on the car's updated_at and stored with relative
+        file URLs; the small version entry also records status and seller so
+        visibility is checked without touching the database.
+        """
+        pk = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        version_key = detail_version_key(pk)
+        state = cache.get(version_key)
+        if state is None:
+            try:
+                row = Car.objects.filter(pk=pk).values('updated_at', 'status', 'seller_id').first()
+            except (ValueError, DjangoValidationError):
+                row = None
+            if row is None:
+                return super().retrieve(request, *args, **kwargs)
+            state = {
+                'version': row['updated_at'].timestamp(),
+                'status': row['status'],
+                'seller_id': row['seller_id'],
+            }
+            cache.set(version_key, state, DETAIL_CACHE_TIMEOUT)
+        
+        user = request.user
+        visible = (
+            state['status'] == 'active'
+            or user.is_staff
+            or (user.is_authenticated and state['seller_id'] == user.pk)
+        )
+        if not visible:
+            return super().retrieve(request, *args, **kwargs)
+        
+        # Cached without the request so one visitor's host and scheme are
+        # never served to the next; URLs are made absolute per request
+        data = cache.get_or_set(
+            detail_key(pk, state['version']),
+            lambda: self.get_serializer(
+                self.get_object(),
+                context={**self.get_serializer_context(), 'request': None}
+            ).data,
+            DETAIL_CACHE_TIMEOUT
+        )
+        return Response(CarDetailSerializer.with_absolute_urls(data, request))
     
     def create(self, request, *args, **kwargs):
         """Create a new car listing."""
@@ -117,48 +232,14 @@ class CarViewSet(viewsets.ModelViewSet):
         queryset = self.get_queryset()
         filters_data = serializer.validated_data
         
-        # Apply filters
-        if 'make' in filters_data:
-            queryset = queryset.filter(make__icontains=filters_data['make'])
-        
-        if 'model' in filters_data:
-            queryset = queryset.filter(model__icontains=filters_data['model'])
-        
-        if 'year_from' in filters_data:
-            queryset = queryset.filter(year__gte=filters_data['year_from'])
+        queryset = queryset.filter(**{
+            lookup: filters_data[param]
+            for param, lookup in self.SEARCH_FILTER_MAP
+            if param in filters_data
+        })
         
-        if 'year_to' in filters_data:
-            queryset = queryset.filter(year__lte=filters_data['year_to'])
-        
-        if 'price_from' in filters_data:
-            queryset = queryset.filter(price__gte=filters_data['price_from'])
-        
-        if 'price_to' in filters_data:
-            queryset = queryset.filter(price__lte=filters_data['price_to'])
-        
-        if 'condition' in filters_data:
-            queryset = queryset.filter(condition=filters_data['condition'])
-        
-        if 'fuel_type' in filters_data:
-            queryset = queryset.filter(fuel_type=filters_data['fuel_type'])
-        
-        if 'transmission' in filters_data:
-            queryset = queryset.filter(transmission=filters_data['transmission'])
-        
-        if 'city' in filters_data:
-            queryset = queryset.filter(city__icontains=filters_data['city'])
-        
-        if 'mileage_max' in filters_data:
-            queryset = queryset.filter(mileage__lte=filters_data['mileage_max'])
-        
-        if 'search' in filters_data:
-            search_term = filters_data['search']
-            queryset = queryset.filter(
-                Q(make__icontains=search_term) |
-                Q(model__icontains=search_term) |
-                Q(title__icontains=search_term) |
-                Q(description__icontains=search_term)
-            )
+        if filters_data.get('search'):
+            queryset = self.apply_search_term(queryset, filters_data['search'])
         
         page = self.paginate_queryset(queryset)
         if page is not None:
@@ -168,18 +249,38 @@ class CarViewSet(viewsets.ModelViewSet):
         serializer = CarListSerializer(queryset, many=True)
         return Response(serializer.data)
     
-    @action(detail=True, methods=['post'])
+    def apply_search_term(self, queryset, term):
+        """
+        Filter cars by a general search term across text fields.
+        
+        On PostgreSQL this uses pg_trgm word similarity, served by the GIN
+        trigram indexes, and ranks by best match; other databases fall back
+        to icontains.
+        """
+        fields = ('make', 'model', 'title', 'description')
+        if connection.vendor != 'postgresql':
+            predicate = Q()
+            for field in fields:
+                predicate |= Q(**{f'{field}__icontains': term})
+            return queryset.filter(predicate)
+        
+        # Imported lazily: these modules require psycopg
+        from django.contrib.postgres.lookups import TrigramWordSimilar
+        from django.contrib.postgres.search import TrigramWordSimilarity
+        from django.db.models.functions import Greatest
+        
+        predicate = Q()
+        for field in fields:
+            predicate |= Q(TrigramWordSimilar(F(field), term))
+        return queryset.filter(predicate).annotate(
+            search_rank=Greatest(*[TrigramWordSimilarity(term, field) for field in fields])
+        ).order_by('-search_rank', '-created_at')
+    
+    @action(detail=True, methods=['post'], permission_classes=[IsOwnerOrStaff])
     def upload_images(self, request, pk=None):
         """Upload images for a car."""
         car = self.get_object()
         
-        # Check permission
-        if car.seller != request.user and not request.user.is_staff:
-            return Response(
-                {'error': 'You can only upload images for your own cars'},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
         images = request.FILES.getlist('images')
         if not images:
             return Response(
@@ -187,31 +288,27 @@ class CarViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        created_images = []
-        for image in images:
-            car_image = CarImage.objects.create(car=car, image=image)
-            created_images.append(CarImageSerializer(car_image).data)
+        created_images = CarImage.bulk_ingest(car, images)
+        invalidate_car_detail(car.id)
         
         return Response(
-            {'images': created_images},
+            {'images': CarImageSerializer(created_images, many=True).data},
             status=status.HTTP_201_CREATED
         )
     
-    @action(detail=True, methods=['post'])
+    @action(detail=True, methods=['post'], permission_classes=[IsOwnerOrStaff])
     def mark_as_sold(self, request, pk=None):
         """Mark a car as sold."""
         car = self.get_object()
-        
-        # Check permission
-        if car.seller != request.user and not request.user.is_staff:
-            return Response(
-                {'error': 'You can only mark your own cars as sold'},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
         car.mark_as_sold()
+        
+        # The full detail payload is opt-in; most clients only need the new state
+        if request.query_params.get('full') == '1':
+            car_data = CarDetailSerializer(car, context=self.get_serializer_context()).data
+        else:
+            car_data = {'id': car.id, 'status': car.status, 'sold_at': car.sold_at}
         return Response(
-            {'message': 'Car marked as sold', 'car': CarDetailSerializer(car).data},
+            {'message': 'Car marked as sold', 'car': car_data},
             status=status.HTTP_200_OK
         )
     
@@ -224,7 +321,7 @@ class CarViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        queryset = Car.objects.filter(seller=request.user).select_related('seller').prefetch_related('images')
+        queryset = Car.objects.filter(seller=request.user).list_values()
         page = self.paginate_queryset(queryset)
         
         if page is not None:
@@ -247,7 +344,7 @@ class CarViewSet(viewsets.ModelViewSet):
         queryset = Car.objects.filter(
             seller_id=seller_id,
             status='active'
-        ).select_related('seller').prefetch_related('images')
+        ).list_values()
         
         page = self.paginate_queryset(queryset)
         if page is not None:
@@ -257,18 +354,11 @@ class CarViewSet(viewsets.ModelViewSet):
         serializer = CarListSerializer(queryset, many=True)
         return Response(serializer.data)
     
-    @action(detail=True, methods=['post'])
+    @action(detail=True, methods=['post'], permission_classes=[IsOwnerOrStaff])
     def set_primary_image(self, request, pk=None):
         """Set primary image for a car."""
         car = self.get_object()
         
-        # Check permission
-        if car.seller != request.user and not request.user.is_staff:
-            return Response(
-                {'error': 'You can only modify your own car images'},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
         image_id = request.data.get('image_id')
         if not image_id:
             return Response(
@@ -278,8 +368,9 @@ class CarViewSet(viewsets.ModelViewSet):
         
         try:
             image = CarImage.objects.get(id=image_id, car=car)
+            CarImage.set_primary(car.id, image.id)
+            invalidate_car_detail(car.id)
             image.is_primary = True
-            image.save()
             return Response(
                 {'message': 'Primary image set', 'image': CarImageSerializer(image).data},
                 status=status.HTTP_200_OK
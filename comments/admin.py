@@ -21,6 +21,6 @@ class CommentReplyAdmin(admin.ModelAdmin):
 @admin.register(CommentLike)
 class CommentLikeAdmin(admin.ModelAdmin):
     list_display = ['user', 'like_type', 'created_at']
-    list_filter = ['like_type', 'created_at']
+    list_filter = [('comment', admin.EmptyFieldListFilter), 'created_at']
     search_fields = ['user__email']
     readonly_fields = ['id', 'created_at']
@@ -4,6 +4,3 @@ from django.apps import AppConfig
 class CommentsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'comments'
-
-    def ready(self):
-        import comments.signals
@@ -0,0 +1,35 @@
+# Generated by Django 6.0 on 2026-10-16 12:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='commentlike',
+            unique_together=set(),
+        ),
+        migrations.RemoveField(
+            model_name='commentlike',
+            name='like_type',
+        ),
+        migrations.AddConstraint(
+            model_name='commentlike',
+            constraint=models.UniqueConstraint(condition=models.Q(('comment__isnull', False)), fields=('user', 'comment'), name='uniq_user_comment_like'),
+        ),
+        migrations.AddConstraint(
+            model_name='commentlike',
+            constraint=models.UniqueConstraint(condition=models.Q(('reply__isnull', False)), fields=('user', 'reply'), name='uniq_user_reply_like'),
+        ),
+        migrations.AddConstraint(
+            model_name='commentlike',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('comment__isnull', False)), models.Q(('reply__isnull', False)), _connector='XOR'), name='exactly_one_target'),
+        ),
+    ]
@@ -0,0 +1,79 @@
+from django.db import migrations
+
+
+# (trigger name, child table, parent fk column, parent table, counter column)
+COUNTERS = [
+    ('comments_like_comment_count', 'comments_commentlike', 'comment_id', 'comments_comment', 'likes_count'),
+    ('comments_like_reply_count', 'comments_commentlike', 'reply_id', 'comments_commentreply', 'likes_count'),
+    ('comments_reply_count', 'comments_commentreply', 'comment_id', 'comments_comment', 'replies_count'),
+]
+
+POSTGRESQL_FUNCTION = """
+CREATE OR REPLACE FUNCTION {name}() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' AND NEW.{fk} IS NOT NULL THEN
+        UPDATE {parent} SET {counter} = {counter} + 1 WHERE id = NEW.{fk};
+    ELSIF TG_OP = 'DELETE' AND OLD.{fk} IS NOT NULL THEN
+        UPDATE {parent} SET {counter} = {counter} - 1 WHERE id = OLD.{fk} AND {counter} > 0;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+POSTGRESQL_TRIGGER = """
+CREATE TRIGGER {name} AFTER INSERT OR DELETE ON {child}
+FOR EACH ROW EXECUTE FUNCTION {name}()
+"""
+
+SQLITE_INSERT_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS {name}_insert AFTER INSERT ON {child}
+WHEN NEW.{fk} IS NOT NULL
+BEGIN
+    UPDATE {parent} SET {counter} = {counter} + 1 WHERE id = NEW.{fk};
+END
+"""
+
+SQLITE_DELETE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS {name}_delete AFTER DELETE ON {child}
+WHEN OLD.{fk} IS NOT NULL
+BEGIN
+    UPDATE {parent} SET {counter} = {counter} - 1 WHERE id = OLD.{fk} AND {counter} > 0;
+END
+"""
+
+
+def create_counter_triggers(apps, schema_editor):
+    # Counters are kept by the database so bulk writes stay consistent.
+    vendor = schema_editor.connection.vendor
+    for name, child, fk, parent, counter in COUNTERS:
+        params = dict(name=name, child=child, fk=fk, parent=parent, counter=counter)
+        if vendor == 'postgresql':
+            schema_editor.execute(POSTGRESQL_FUNCTION.format(**params))
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {name} ON {child}')
+            schema_editor.execute(POSTGRESQL_TRIGGER.format(**params))
+        elif vendor == 'sqlite':
+            schema_editor.execute(SQLITE_INSERT_TRIGGER.format(**params))
+            schema_editor.execute(SQLITE_DELETE_TRIGGER.format(**params))
+
+
+def drop_counter_triggers(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for name, child, *_ in COUNTERS:
+        if vendor == 'postgresql':
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {name} ON {child}')
+            schema_editor.execute(f'DROP FUNCTION IF EXISTS {name}()')
+        elif vendor == 'sqlite':
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {name}_insert')
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {name}_delete')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0002_alter_commentlike_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_counter_triggers, drop_counter_triggers),
+    ]
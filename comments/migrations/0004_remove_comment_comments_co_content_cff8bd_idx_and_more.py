@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-16 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0003_comment_counter_triggers'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='comment',
+            name='comments_co_content_cff8bd_idx',
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['content_type', 'object_id', 'is_approved', '-created_at'], name='comments_co_content_ba3566_idx'),
+        ),
+    ]
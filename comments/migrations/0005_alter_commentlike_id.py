@@ -0,0 +1,27 @@
+from importlib import import_module
+
+import mvpbackend.ids
+from django.db import migrations, models
+
+
+def reinstall_counter_triggers(apps, schema_editor):
+    # SQLite alters the default by rebuilding the table, which drops the
+    # like counter triggers on it; their SQL is idempotent.
+    triggers = import_module('comments.migrations.0003_comment_counter_triggers')
+    triggers.create_counter_triggers(apps, schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0004_remove_comment_comments_co_content_cff8bd_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='commentlike',
+            name='id',
+            field=models.UUIDField(default=mvpbackend.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.RunPython(reinstall_counter_triggers, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,10 @@
 from django.db import models
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
 import uuid
+from mvpbackend.db import insert_unless_exists
+from mvpbackend.ids import uuid7
 from users.models import CustomUser
 
 
@@ -37,7 +40,8 @@ class Comment(models.Model):
     class Meta:
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['content_type', 'object_id']),
+            # Serves by_object: filter by target and approval, newest first
+            models.Index(fields=['content_type', 'object_id', 'is_approved', '-created_at']),
             models.Index(fields=['author']),
         ]
     
@@ -85,27 +89,53 @@ class CommentLike(models.Model):
     Track likes on comments and replies.
     """
     
-    LIKE_TYPE_CHOICES = (
-        ('comment', 'Comment'),
-        ('reply', 'Reply'),
-    )
-    
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='comment_likes')
     
-    # Generic relation to Comment or CommentReply
-    like_type = models.CharField(max_length=20, choices=LIKE_TYPE_CHOICES)
+    # Exactly one of comment or reply is set
     comment = models.ForeignKey(Comment, on_delete=models.CASCADE, null=True, blank=True)
     reply = models.ForeignKey(CommentReply, on_delete=models.CASCADE, null=True, blank=True)
     
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
-        unique_together = [
-            ('user', 'comment'),
-            ('user', 'reply'),
-        ]
         ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'comment'],
+                condition=models.Q(comment__isnull=False),
+                name='uniq_user_comment_like'
+            ),
+            models.UniqueConstraint(
+                fields=['user', 'reply'],
+                condition=models.Q(reply__isnull=False),
+                name='uniq_user_reply_like'
+            ),
+            models.CheckConstraint(
+                condition=models.Q(comment__isnull=False) ^ models.Q(reply__isnull=False),
+                name='exactly_one_target'
+            ),
+        ]
     
     def __str__(self):
         return f"Like by {self.user.get_full_name()}"
+    
+    @property
+    def like_type(self):
+        """Return whether this like targets a comment or a reply."""
+        return 'comment' if self.comment_id else 'reply'
+    
+    @classmethod
+    def add(cls, user, **target):
+        """
+        Record a like unless it already exists; return whether it was created.
+        
+        target is comment=... or reply=....
+        """
+        (target_field, obj), = target.items()
+        return insert_unless_exists(cls, {
+            'id': uuid7(),
+            'user': user.pk,
+            target_field: obj.pk,
+            'created_at': timezone.now(),
+        })
@@ -31,14 +31,17 @@ class CommentReplySerializer(serializers.ModelSerializer):
     
     def get_user_liked(self, obj):
         """Check if current user liked this reply."""
+        # Set by the viewsets' Exists() annotation
+        if hasattr(obj, 'user_liked_annot'):
+            return obj.user_liked_annot
+        
         request = self.context.get('request')
         if not request or not request.user.is_authenticated:
             return False
         
         return CommentLike.objects.filter(
             user=request.user,
-            reply=obj,
-            like_type='reply'
+            reply=obj
         ).exists()
 
 
@@ -63,14 +66,17 @@ class CommentSerializer(serializers.ModelSerializer):
     
     def get_user_liked(self, obj):
         """Check if current user liked this comment."""
+        # Set by the viewsets' Exists() annotation
+        if hasattr(obj, 'user_liked_annot'):
+            return obj.user_liked_annot
+        
         request = self.context.get('request')
         if not request or not request.user.is_authenticated:
             return False
         
         return CommentLike.objects.filter(
             user=request.user,
-            comment=obj,
-            like_type='comment'
+            comment=obj
         ).exists()
 
 
@@ -84,9 +90,18 @@ class CommentCreateSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         """Create comment with author from request user."""
         validated_data['author'] = self.context['request'].user
-        validated_data['content_type'] = self.context['content_type']
+        validated_data['content_type_id'] = self.context['content_type'].pk
         validated_data['object_id'] = self.context['object_id']
-        return super().create(validated_data)
+        comment = super().create(validated_data)
+        # A new comment has no replies or likes yet; prime both so that
+        # rendering it does not query for them
+        comment._prefetched_objects_cache = {'replies': CommentReply.objects.none()}
+        comment.user_liked_annot = False
+        return comment
+    
+    def to_representation(self, instance):
+        """Render the created comment the way CommentSerializer does."""
+        return CommentSerializer(instance, context=self.context).data
 
 
 class CommentReplyCreateSerializer(serializers.ModelSerializer):
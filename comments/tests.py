@@ -1,4 +1,5 @@
 from django.test import TestCase
+from django.db import IntegrityError, transaction
 from django.contrib.auth import get_user_model
 from comments.models import Comment, CommentReply, CommentLike
 from cars.models import Car
@@ -12,19 +13,20 @@ User = get_user_model()
 class CommentModelTest(TestCase):
     """Test suite for Comment model"""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email="commenter@example.com",
             password="pass123",
             first_name="Commenter", last_name="User"
         )
-        self.seller = User.objects.create_user(
+        cls.seller = User.objects.create_user(
             email="seller@example.com",
             password="pass123",
             first_name="Seller", last_name="User"
         )
-        self.car = Car.objects.create(
-            seller=self.seller,
+        cls.car = Car.objects.create(
+            seller=cls.seller,
             make="Toyota",
             model="Camry",
             year=2020,
@@ -81,24 +83,25 @@ class CommentModelTest(TestCase):
 class CommentReplyModelTest(TestCase):
     """Test suite for CommentReply model"""
 
-    def setUp(self):
-        self.user1 = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(
             email="user1@example.com",
             password="pass123",
             first_name="User", last_name="One"
         )
-        self.user2 = User.objects.create_user(
+        cls.user2 = User.objects.create_user(
             email="user2@example.com",
             password="pass123",
             first_name="User", last_name="Two"
         )
-        self.seller = User.objects.create_user(
+        cls.seller = User.objects.create_user(
             email="seller@example.com",
             password="pass123",
             first_name="Seller", last_name="User"
         )
-        self.car = Car.objects.create(
-            seller=self.seller,
+        cls.car = Car.objects.create(
+            seller=cls.seller,
             make="Honda",
             model="Civic",
             year=2021,
@@ -108,9 +111,9 @@ class CommentReplyModelTest(TestCase):
             fuel_type="petrol",
             condition="used"
         )
-        self.comment = Comment.objects.create(
-            author=self.user1,
-            content_object=self.car,
+        cls.comment = Comment.objects.create(
+            author=cls.user1,
+            content_object=cls.car,
             text="Is this still available?"
         )
 
@@ -150,28 +153,42 @@ class CommentReplyModelTest(TestCase):
         
         self.assertEqual(self.comment.replies.count(), 2)
 
+    def test_replies_count_tracks_bulk_writes(self):
+        """Test that the reply count follows bulk inserts and deletes"""
+        CommentReply.objects.bulk_create([
+            CommentReply(comment=self.comment, author=self.seller, text="Reply 1"),
+            CommentReply(comment=self.comment, author=self.user2, text="Reply 2"),
+        ])
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.replies_count, 2)
+        
+        CommentReply.objects.filter(comment=self.comment).delete()
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.replies_count, 0)
+
 
 class CommentLikeModelTest(TestCase):
     """Test suite for CommentLike model"""
 
-    def setUp(self):
-        self.user1 = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(
             email="user1@example.com",
             password="pass123",
             first_name="User", last_name="One"
         )
-        self.user2 = User.objects.create_user(
+        cls.user2 = User.objects.create_user(
             email="user2@example.com",
             password="pass123",
             first_name="User", last_name="Two"
         )
-        self.seller = User.objects.create_user(
+        cls.seller = User.objects.create_user(
             email="seller@example.com",
             password="pass123",
             first_name="Seller", last_name="User"
         )
-        self.car = Car.objects.create(
-            seller=self.seller,
+        cls.car = Car.objects.create(
+            seller=cls.seller,
             make="Ford",
             model="Mustang",
             year=2022,
@@ -181,9 +198,9 @@ class CommentLikeModelTest(TestCase):
             fuel_type="petrol",
             condition="used"
         )
-        self.comment = Comment.objects.create(
-            author=self.user1,
-            content_object=self.car,
+        cls.comment = Comment.objects.create(
+            author=cls.user1,
+            content_object=cls.car,
             text="Amazing car!"
         )
 
@@ -209,6 +226,15 @@ class CommentLikeModelTest(TestCase):
                 comment=self.comment
             )
 
+    def test_add_skips_existing_like(self):
+        """Test that add reports whether a like was inserted"""
+        self.assertTrue(CommentLike.add(self.user2, comment=self.comment))
+        self.assertFalse(CommentLike.add(self.user2, comment=self.comment))
+        
+        self.assertEqual(CommentLike.objects.filter(user=self.user2).count(), 1)
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.likes_count, 1)
+
     def test_like_reply(self):
         """Test liking a reply"""
         reply = CommentReply.objects.create(
@@ -236,3 +262,27 @@ class CommentLikeModelTest(TestCase):
         CommentLike.objects.create(user=user3, comment=self.comment)
         
         self.assertEqual(CommentLike.objects.filter(comment=self.comment).count(), 3)
+
+    def test_likes_count_tracks_likes(self):
+        """Test that the comment like count follows creates and deletes"""
+        like = CommentLike.objects.create(user=self.user1, comment=self.comment)
+        CommentLike.objects.create(user=self.user2, comment=self.comment)
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.likes_count, 2)
+        
+        like.delete()
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.likes_count, 1)
+
+    def test_like_requires_exactly_one_target(self):
+        """Test that a like must target either a comment or a reply"""
+        reply = CommentReply.objects.create(
+            comment=self.comment,
+            author=self.seller,
+            text="Thanks!"
+        )
+        
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            CommentLike.objects.create(user=self.user2)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            CommentLike.objects.create(user=self.user2, comment=self.comment, reply=reply)
@@ -0,0 +1,8 @@
+from rest_framework.routers import SimpleRouter
+from comments.views import CommentViewSet, CommentReplyViewSet
+
+router = SimpleRouter()
+router.register(r'comments', CommentViewSet, basename='comment')
+router.register(r'comment-replies', CommentReplyViewSet, basename='comment-reply')
+
+urlpatterns = router.urls
@@ -1,13 +1,39 @@
+from functools import lru_cache
+
 from rest_framework import viewsets, status, permissions, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.throttling import UserRateThrottle
+from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import Exists, OuterRef, Prefetch
 from comments.models import Comment, CommentReply, CommentLike
 from comments.serializers import (
     CommentSerializer, CommentReplySerializer, CommentCreateSerializer,
     CommentReplyCreateSerializer
 )
+from users.api.serializers import USER_LIST_COLUMNS
+
+
+# Columns rendered by CommentSerializer on list endpoints
+COMMENT_LIST_COLUMNS = (
+    'id', 'author', 'text', 'likes_count', 'replies_count', 'is_approved',
+    'is_flagged', 'created_at', 'updated_at',
+    *[f'author__{name}' for name in USER_LIST_COLUMNS]
+)
+
+# Commentable models, keyed by the content_type value clients send
+COMMENTABLE_MODELS = {
+    'car': ('cars', 'Car'),
+    'part': ('parts', 'CarPart'),
+}
+
+
+@lru_cache(maxsize=None)
+def _ct_for(kind):
+    """Return the ContentType for a commentable kind; callers check the kind first."""
+    return ContentType.objects.get_for_model(apps.get_model(*COMMENTABLE_MODELS[kind]))
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -17,6 +43,14 @@ class StandardResultsSetPagination(PageNumberPagination):
     max_page_size = 100
 
 
+class CommentCursorPagination(CursorPagination):
+    """Keyset pagination for comment listings, newest first."""
+    ordering = '-created_at'
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
 class IsOwnerOrReadOnly(permissions.BasePermission):
     """Permission to only allow owners to edit their comments."""
     
@@ -26,7 +60,89 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
         return obj.author == request.user
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+def annotate_user_liked(queryset, user, target):
+    """
+    Annotate whether the user liked each comment or reply.
+    
+    target is the CommentLike field pointing at the queryset's model
+    ('comment' or 'reply'); the semi-join runs inside the main SELECT.
+    """
+    if not user.is_authenticated:
+        return queryset
+    return queryset.annotate(
+        user_liked_annot=Exists(
+            CommentLike.objects.filter(user_id=user.id, **{target: OuterRef('pk')})
+        )
+    )
+
+
+def replies_prefetch(user):
+    """
+    Prefetch visible replies with their authors and the user's like status.
+    
+    Non-staff users only get approved replies or their own, as in
+    CommentReplyViewSet.
+    """
+    replies = CommentReply.objects.select_related('author')
+    if not user.is_staff:
+        visible = Q(is_approved=True)
+        if user.is_authenticated:
+            visible |= Q(author=user)
+        replies = replies.filter(visible)
+    return Prefetch('replies', queryset=annotate_user_liked(replies, user, 'reply'))
+
+
+class LikeRateThrottle(UserRateThrottle):
+    """Per-user rate limit on like/unlike, counted in the shared cache."""
+    scope = 'likes'
+
+
+class LikeActionMixin:
+    """
+    like/unlike actions shared by the comment and reply viewsets.
+    
+    like_type_field is the CommentLike field pointing at the viewset's
+    model ('comment' or 'reply').
+    """
+    
+    like_type_field = None
+    
+    @action(detail=True, methods=['post'], throttle_classes=[LikeRateThrottle])
+    def like(self, request, pk=None):
+        """Like a comment or reply."""
+        target = self.get_object()
+        
+        if CommentLike.add(request.user, **{self.like_type_field: target}):
+            return Response(
+                {'message': f'{self.like_type_field.capitalize()} liked'},
+                status=status.HTTP_201_CREATED
+            )
+        return Response(
+            {'message': 'Already liked'},
+            status=status.HTTP_200_OK
+        )
+    
+    @action(detail=True, methods=['post'], throttle_classes=[LikeRateThrottle])
+    def unlike(self, request, pk=None):
+        """Unlike a comment or reply."""
+        target = self.get_object()
+        
+        deleted, _ = CommentLike.objects.filter(
+            user=request.user,
+            **{self.like_type_field: target}
+        ).delete()
+        if deleted:
+            return Response(
+                {'message': f'{self.like_type_field.capitalize()} unliked'},
+                status=status.HTTP_200_OK
+            )
+        return Response(
+            {'error': 'Not liked'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+
+class CommentViewSet(LikeActionMixin, viewsets.ModelViewSet):
     """
     ViewSet for comments on cars and parts.
     
@@ -40,9 +156,10 @@ class CommentViewSet(viewsets.ModelViewSet):
     queryset = Comment.objects.filter(is_approved=True)
     serializer_class = CommentSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsOwnerOrReadOnly]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = CommentCursorPagination
     ordering_fields = ['created_at', 'likes_count']
     ordering = ['-created_at']
+    like_type_field = 'comment'
     
     def get_queryset(self):
         """Filter queryset based on user."""
@@ -54,7 +171,12 @@ class CommentViewSet(viewsets.ModelViewSet):
                 Q(is_approved=True) | Q(author=self.request.user)
             )
         
-        return queryset.select_related('author').prefetch_related('replies')
+        queryset = queryset.select_related('author').prefetch_related(
+            replies_prefetch(self.request.user)
+        )
+        if self.action == 'list':
+            queryset = queryset.only(*COMMENT_LIST_COLUMNS)
+        return annotate_user_liked(queryset, self.request.user, 'comment')
     
     def create(self, request, *args, **kwargs):
         """Create a comment on a car or part."""
@@ -67,20 +189,13 @@ class CommentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Validate content type
-        if content_type_str not in ['car', 'part']:
+        # JSON bodies may carry any type here; only known strings reach the cache
+        if not isinstance(content_type_str, str) or content_type_str not in COMMENTABLE_MODELS:
             return Response(
                 {'error': 'content_type must be "car" or "part"'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        
-        # Get content type
-        if content_type_str == 'car':
-            from cars.models import Car
-            content_type = ContentType.objects.get_for_model(Car)
-        else:
-            from parts.models import CarPart
-            content_type = ContentType.objects.get_for_model(CarPart)
+        content_type = _ct_for(content_type_str)
         
         serializer = CommentCreateSerializer(
             data=request.data,
@@ -91,61 +206,9 @@ class CommentViewSet(viewsets.ModelViewSet):
             }
         )
         serializer.is_valid(raise_exception=True)
-        comment = serializer.save()
+        serializer.save()
         
-        return Response(
-            CommentSerializer(comment).data,
-            status=status.HTTP_201_CREATED
-        )
-    
-    @action(detail=True, methods=['post'])
-    def like(self, request, pk=None):
-        """Like a comment."""
-        comment = self.get_object()
-        
-        # Check if already liked
-        like, created = CommentLike.objects.get_or_create(
-            user=request.user,
-            comment=comment,
-            like_type='comment'
-        )
-        
-        if created:
-            comment.likes_count += 1
-            comment.save(update_fields=['likes_count'])
-            return Response(
-                {'message': 'Comment liked'},
-                status=status.HTTP_201_CREATED
-            )
-        else:
-            return Response(
-                {'message': 'Already liked'},
-                status=status.HTTP_200_OK
-            )
-    
-    @action(detail=True, methods=['post'])
-    def unlike(self, request, pk=None):
-        """Unlike a comment."""
-        comment = self.get_object()
-        
-        try:
-            like = CommentLike.objects.get(
-                user=request.user,
-                comment=comment,
-                like_type='comment'
-            )
-            like.delete()
-            comment.likes_count -= 1
-            comment.save(update_fields=['likes_count'])
-            return Response(
-                {'message': 'Comment unliked'},
-                status=status.HTTP_200_OK
-            )
-        except CommentLike.DoesNotExist:
-            return Response(
-                {'error': 'Not liked'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
     
     @action(detail=True, methods=['post'])
     def reply(self, request, pk=None):
@@ -159,10 +222,6 @@ class CommentViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         reply = serializer.save()
         
-        # Update reply count
-        comment.replies_count += 1
-        comment.save(update_fields=['replies_count'])
-        
         return Response(
             CommentReplySerializer(reply).data,
             status=status.HTTP_201_CREATED
@@ -180,24 +239,21 @@ class CommentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Get content type
-        if content_type_str == 'car':
-            from cars.models import Car
-            content_type = ContentType.objects.get_for_model(Car)
-        elif content_type_str == 'part':
-            from parts.models import CarPart
-            content_type = ContentType.objects.get_for_model(CarPart)
-        else:
+        if content_type_str not in COMMENTABLE_MODELS:
             return Response(
                 {'error': 'Invalid content_type'},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        content_type = _ct_for(content_type_str)
         
         queryset = Comment.objects.filter(
             content_type=content_type,
             object_id=object_id,
             is_approved=True
-        ).select_related('author').prefetch_related('replies')
+        ).select_related('author').prefetch_related(
+            replies_prefetch(request.user)
+        ).only(*COMMENT_LIST_COLUMNS)
+        queryset = annotate_user_liked(queryset, request.user, 'comment')
         
         page = self.paginate_queryset(queryset)
         if page is not None:
@@ -208,7 +264,7 @@ class CommentViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class CommentReplyViewSet(viewsets.ModelViewSet):
+class CommentReplyViewSet(LikeActionMixin, viewsets.ModelViewSet):
     """ViewSet for comment replies."""
     
     queryset = CommentReply.objects.filter(is_approved=True)
@@ -217,6 +273,7 @@ class CommentReplyViewSet(viewsets.ModelViewSet):
     pagination_class = StandardResultsSetPagination
     ordering_fields = ['created_at', 'likes_count']
     ordering = ['created_at']
+    like_type_field = 'reply'
     
     def get_queryset(self):
         """Filter queryset based on user."""
@@ -228,56 +285,8 @@ class CommentReplyViewSet(viewsets.ModelViewSet):
                 Q(is_approved=True) | Q(author=self.request.user)
             )
         
-        return queryset.select_related('author', 'comment')
-    
-    @action(detail=True, methods=['post'])
-    def like(self, request, pk=None):
-        """Like a reply."""
-        reply = self.get_object()
-        
-        # Check if already liked
-        like, created = CommentLike.objects.get_or_create(
-            user=request.user,
-            reply=reply,
-            like_type='reply'
-        )
-        
-        if created:
-            reply.likes_count += 1
-            reply.save(update_fields=['likes_count'])
-            return Response(
-                {'message': 'Reply liked'},
-                status=status.HTTP_201_CREATED
-            )
-        else:
-            return Response(
-                {'message': 'Already liked'},
-                status=status.HTTP_200_OK
-            )
-    
-    @action(detail=True, methods=['post'])
-    def unlike(self, request, pk=None):
-        """Unlike a reply."""
-        reply = self.get_object()
-        
-        try:
-            like = CommentLike.objects.get(
-                user=request.user,
-                reply=reply,
-                like_type='reply'
-            )
-            like.delete()
-            reply.likes_count -= 1
-            reply.save(update_fields=['likes_count'])
-            return Response(
-                {'message': 'Reply unliked'},
-                status=status.HTTP_200_OK
-            )
-        except CommentLike.DoesNotExist:
-            return Response(
-                {'error': 'Not liked'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        queryset = queryset.select_related('author', 'comment')
+        return annotate_user_liked(queryset, self.request.user, 'reply')
 
 
 # Import Q for filtering
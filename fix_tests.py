@@ -3,6 +3,9 @@ Script to fix all test files with correct field names
 """
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+import shutil
+import tempfile
 
 # Define all test files that need updating
 test_files = [
@@ -19,42 +22,52 @@ test_files = [
     'integration_tests.py',
 ]
 
+# Pattern: User.objects.create_user(..., full_name="Name", ...)
+FULL_NAME_PATTERN = re.compile(
+    r'(User\.objects\.create_user\([^)]*?)full_name\s*=\s*["\']([^"\']+)["\']'
+)
+
+
+def replace_full_name(match):
+    """Replace full_name= with first_name= and last_name="""
+    prefix = match.group(1)
+    name = match.group(2)
+    # Split name into first and last
+    parts = name.split()
+    if len(parts) >= 2:
+        first = parts[0]
+        last = ' '.join(parts[1:])
+    else:
+        first = name
+        last = "User"
+    return f'{prefix}first_name="{first}", last_name="{last}"'
+
+
+def write_atomic(filepath, content):
+    """Write content to a temp file beside filepath, then swap it in"""
+    directory = os.path.dirname(filepath) or '.'
+    with tempfile.NamedTemporaryFile(
+        'w', encoding='utf-8', dir=directory, delete=False
+    ) as f:
+        f.write(content)
+    shutil.copymode(filepath, f.name)
+    os.replace(f.name, filepath)
+
+
 def fix_file(filepath):
     """Fix user creation calls in test files"""
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        original_content = content
-        
-        # Replace full_name= with first_name= and last_name=
-        # Pattern: User.objects.create_user(..., full_name="Name", ...)
-        pattern = r'(User\.objects\.create_user\([^)]*?)full_name\s*=\s*["\']([^"\']+)["\']'
-        
-        def replace_full_name(match):
-            prefix = match.group(1)
-            name = match.group(2)
-            # Split name into first and last
-            parts = name.split()
-            if len(parts) >= 2:
-                first = parts[0]
-                last = ' '.join(parts[1:])
-            else:
-                first = name
-                last = "User"
-            return f'{prefix}first_name="{first}", last_name="{last}"'
+            original_content = f.read()
         
-        content = re.sub(pattern, replace_full_name, content)
+        content = FULL_NAME_PATTERN.sub(replace_full_name, original_content)
         
         # Replace SellerRating with Rating
         content = content.replace('SellerRating', 'Rating')
-        content = content.replace('from ratings.models import Review, Rating, ReviewVote', 
-                                'from ratings.models import Review, Rating, ReviewVote')
         
         # Write back if changed
         if content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            write_atomic(filepath, content)
             print(f"✅ Fixed: {filepath}")
             return True
         else:
@@ -68,9 +81,8 @@ def fix_file(filepath):
         return False
 
 if __name__ == '__main__':
-    fixed_count = 0
-    for test_file in test_files:
-        if fix_file(test_file):
-            fixed_count += 1
+    # Files are independent, so fix them on all cores
+    with ProcessPoolExecutor() as executor:
+        fixed_count = sum(executor.map(fix_file, test_files))
     
     print(f"\n✅ Fixed {fixed_count} files")
@@ -0,0 +1,109 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from forum.models import ForumThread
+
+
+RESPONSE_LIST_CACHE_TIMEOUT = 300
+THREAD_DETAIL_CACHE_TIMEOUT = 300
+CATEGORY_LIST_CACHE_TIMEOUT = 3600
+CATEGORY_LIST_KEY = 'forum:categories:active'
+
+
+def thread_views_key(thread_id):
+    """Cache key holding views of a thread not yet written to the database."""
+    return f'forum:thread:{thread_id}:views'
+
+
+def record_thread_view(thread_id):
+    """
+    Count one view of a thread; return the views pending in the cache.
+    
+    Views are buffered in the cache and written to views_count in batches
+    of FORUM_VIEW_FLUSH_EVERY with a single UPDATE, so a hot thread does
+    not take a row lock on every read. The request whose increment lands
+    on a multiple of the batch size does the write, so each buffered view
+    is flushed exactly once. With a batch size of 1 every view is written
+    straight through, which is the default unless a shared cache is set.
+    """
+    flush_every = settings.FORUM_VIEW_FLUSH_EVERY
+    if flush_every <= 1:
+        ForumThread.objects.filter(pk=thread_id).update(views_count=F('views_count') + 1)
+        return 1
+    
+    key = thread_views_key(thread_id)
+    if cache.add(key, 1, timeout=None):
+        pending = 1
+    else:
+        try:
+            pending = cache.incr(key)
+        except ValueError:
+            # Evicted between add() and incr()
+            cache.add(key, 1, timeout=None)
+            pending = 1
+    
+    if pending % flush_every == 0:
+        ForumThread.objects.filter(pk=thread_id).update(
+            views_count=F('views_count') + flush_every
+        )
+        try:
+            cache.decr(key, flush_every)
+        except ValueError:
+            # Evicted after incr(); the batch is written, so nothing is pending
+            pass
+    return pending
+
+
+def response_list_version_key(thread_id):
+    """Cache key holding the current version of a thread's response list."""
+    return f'forum:thread:{thread_id}:responses:v'
+
+
+def response_list_version(thread_id):
+    """
+    Current version of a thread's responses; moved on by every write to them.
+    
+    The version starts at the current time in milliseconds so that, if it
+    is evicted, payloads cached under an older version are never reused.
+    """
+    version_key = response_list_version_key(thread_id)
+    cache.add(version_key, time.time_ns() // 1_000_000, timeout=None)
+    return cache.get(version_key)
+
+
+def response_list_key(thread_id, url):
+    """Cache key for one rendered page of a thread's response list."""
+    version = response_list_version(thread_id)
+    digest = hashlib.md5(url.encode()).hexdigest()
+    return f'forum:thread:{thread_id}:responses:{version}:{digest}'
+
+
+def thread_detail_key(thread, url):
+    """
+    Cache key for a thread's rendered detail, without per-user state.
+    
+    Editing the thread moves its updated_at, and responses written through
+    the API move their version; responses_count also catches ones added
+    elsewhere. Any of these lands on a new key.
+    """
+    version = response_list_version(thread.pk)
+    fingerprint = f'{thread.updated_at.timestamp()}:{thread.responses_count}:{version}'
+    digest = hashlib.md5(url.encode()).hexdigest()
+    return f'forum:thread:{thread.pk}:detail:{fingerprint}:{digest}'
+
+
+def invalidate_response_list(thread_id):
+    """Retire every cached page of a thread's response list."""
+    try:
+        cache.incr(response_list_version_key(thread_id))
+    except ValueError:
+        # No version yet, so nothing has been cached
+        pass
+
+
+def invalidate_category_list():
+    """Drop the cached rows of the active category list."""
+    cache.delete(CATEGORY_LIST_KEY)
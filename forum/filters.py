@@ -0,0 +1,29 @@
+import uuid
+
+from django_filters import rest_framework as filters
+from forum.models import ForumThread
+
+
+class ForumThreadFilter(filters.FilterSet):
+    """
+    Filters for the thread list.
+    
+    author takes a user id or "me" for the requesting user's own threads.
+    """
+    
+    author = filters.CharFilter(method='filter_author')
+    category = filters.UUIDFilter(field_name='category_id')
+    
+    class Meta:
+        model = ForumThread
+        fields = ['author', 'category', 'status']
+    
+    def filter_author(self, queryset, name, value):
+        """Resolve "me" to the requesting user; anything else must be a user id."""
+        if value == 'me':
+            user = self.request.user
+            return queryset.filter(author=user) if user.is_authenticated else queryset.none()
+        try:
+            return queryset.filter(author_id=uuid.UUID(value))
+        except ValueError:
+            return queryset.none()
@@ -1,36 +1,62 @@
 from django.core.management.base import BaseCommand
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
 from forum.models import ForumThread, ForumResponse
 
 
 class Command(BaseCommand):
     help = 'Update forum thread response counts and response vote counts'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows per bulk UPDATE statement when fixing vote counts'
+        )
+
     def handle(self, *args, **options):
         self.stdout.write('Updating forum thread response counts...')
         
-        # Update all thread response counts
-        updated_threads = 0
-        for thread in ForumThread.objects.all():
-            actual_count = thread.responses.count()
-            if thread.responses_count != actual_count:
-                thread.responses_count = actual_count
-                thread.save(update_fields=['responses_count'])
-                updated_threads += 1
+        # Recount every thread in one UPDATE, touching only stale rows
+        response_counts = ForumResponse.objects.filter(
+            thread=OuterRef('pk')
+        ).order_by().values('thread').annotate(total=Count('*')).values('total')
+        actual_count = Coalesce(
+            Subquery(response_counts, output_field=IntegerField()), Value(0)
+        )
+        updated_threads = ForumThread.objects.annotate(
+            actual_count=actual_count
+        ).exclude(
+            responses_count=F('actual_count')
+        ).update(responses_count=actual_count)
         
         self.stdout.write(self.style.SUCCESS(f'✓ Updated {updated_threads} thread response counts'))
         
         # Update all response vote counts
         self.stdout.write('Updating response vote counts...')
+        stale_responses = ForumResponse.objects.annotate(
+            actual_helpful=Count('votes', filter=Q(votes__vote_type='helpful')),
+            actual_unhelpful=Count('votes', filter=Q(votes__vote_type='unhelpful')),
+        ).filter(
+            ~Q(helpful_count=F('actual_helpful')) | ~Q(unhelpful_count=F('actual_unhelpful'))
+        ).order_by().values_list('pk', 'actual_helpful', 'actual_unhelpful')
+        
+        # Stream stale rows and flush one batch at a time to bound memory
         updated_responses = 0
-        for response in ForumResponse.objects.all():
-            helpful_count = response.votes.filter(vote_type='helpful').count()
-            unhelpful_count = response.votes.filter(vote_type='unhelpful').count()
-            
-            if response.helpful_count != helpful_count or response.unhelpful_count != unhelpful_count:
-                response.helpful_count = helpful_count
-                response.unhelpful_count = unhelpful_count
-                response.save(update_fields=['helpful_count', 'unhelpful_count'])
-                updated_responses += 1
+        batch = []
+        for pk, helpful, unhelpful in stale_responses.iterator(chunk_size=2000):
+            batch.append(ForumResponse(pk=pk, helpful_count=helpful, unhelpful_count=unhelpful))
+            if len(batch) >= options['batch_size']:
+                updated_responses += self.flush_vote_counts(batch)
+                batch = []
+        updated_responses += self.flush_vote_counts(batch)
         
         self.stdout.write(self.style.SUCCESS(f'✓ Updated {updated_responses} response vote counts'))
         self.stdout.write(self.style.SUCCESS('All forum counts updated successfully!'))
+
+    def flush_vote_counts(self, responses):
+        """Write a batch of recomputed vote counts; return how many were written."""
+        if responses:
+            ForumResponse.objects.bulk_update(responses, ['helpful_count', 'unhelpful_count'])
+        return len(responses)
@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-16 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forum', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='forumresponse',
+            name='forum_forum_thread__a3f546_idx',
+        ),
+        migrations.AddIndex(
+            model_name='forumresponse',
+            index=models.Index(fields=['thread', '-is_expert_response', '-helpful_count', 'created_at'], name='forum_forum_thread__157e73_idx'),
+        ),
+    ]
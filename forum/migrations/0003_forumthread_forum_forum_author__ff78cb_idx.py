@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-16 13:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forum', '0002_remove_forumresponse_forum_forum_thread__a3f546_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='forumthread',
+            index=models.Index(fields=['author', '-created_at'], name='forum_forum_author__ff78cb_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-16 13:35
+
+import mvpbackend.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forum', '0003_forumthread_forum_forum_author__ff78cb_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='responsevote',
+            name='id',
+            field=models.UUIDField(default=mvpbackend.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,160 @@
+from django.db import migrations
+
+
+# PostgreSQL: statement-level triggers over transition tables, so a bulk
+# write adjusts each parent row once per statement.
+POSTGRESQL_THREAD_RESPONSES = """
+CREATE OR REPLACE FUNCTION forum_thread_responses_{op}() RETURNS trigger AS $$
+BEGIN
+    UPDATE forum_forumthread AS t
+    SET responses_count = GREATEST(t.responses_count {sign} d.n, 0)
+    FROM (SELECT thread_id, count(*) AS n FROM {rows} GROUP BY thread_id) AS d
+    WHERE t.id = d.thread_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+POSTGRESQL_VOTE_COUNTS = """
+CREATE OR REPLACE FUNCTION forum_response_votes_{op}() RETURNS trigger AS $$
+BEGIN
+    UPDATE forum_forumresponse AS r
+    SET helpful_count = GREATEST(r.helpful_count + d.helpful, 0),
+        unhelpful_count = GREATEST(r.unhelpful_count + d.unhelpful, 0)
+    FROM (
+        SELECT response_id,
+               SUM(CASE WHEN vote_type = 'helpful' THEN delta ELSE 0 END) AS helpful,
+               SUM(CASE WHEN vote_type = 'unhelpful' THEN delta ELSE 0 END) AS unhelpful
+        FROM ({changes}) AS c
+        GROUP BY response_id
+    ) AS d
+    WHERE r.id = d.response_id AND (d.helpful <> 0 OR d.unhelpful <> 0);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+POSTGRESQL_TRIGGER = """
+CREATE TRIGGER {name} AFTER {event} ON {table}
+REFERENCING {referencing}
+FOR EACH STATEMENT EXECUTE FUNCTION {name}()
+"""
+
+NEW_VOTES = "SELECT response_id, vote_type, 1 AS delta FROM new_rows"
+OLD_VOTES = "SELECT response_id, vote_type, -1 AS delta FROM old_rows"
+
+# (function/trigger name, function SQL, event, table, referencing clause)
+POSTGRESQL_TRIGGERS = [
+    (
+        'forum_thread_responses_insert',
+        POSTGRESQL_THREAD_RESPONSES.format(op='insert', sign='+', rows='new_rows'),
+        'INSERT', 'forum_forumresponse', 'NEW TABLE AS new_rows',
+    ),
+    (
+        'forum_thread_responses_delete',
+        POSTGRESQL_THREAD_RESPONSES.format(op='delete', sign='-', rows='old_rows'),
+        'DELETE', 'forum_forumresponse', 'OLD TABLE AS old_rows',
+    ),
+    (
+        'forum_response_votes_insert',
+        POSTGRESQL_VOTE_COUNTS.format(op='insert', changes=NEW_VOTES),
+        'INSERT', 'forum_responsevote', 'NEW TABLE AS new_rows',
+    ),
+    (
+        'forum_response_votes_delete',
+        POSTGRESQL_VOTE_COUNTS.format(op='delete', changes=OLD_VOTES),
+        'DELETE', 'forum_responsevote', 'OLD TABLE AS old_rows',
+    ),
+    (
+        'forum_response_votes_update',
+        POSTGRESQL_VOTE_COUNTS.format(op='update', changes=f'{NEW_VOTES} UNION ALL {OLD_VOTES}'),
+        'UPDATE', 'forum_responsevote', 'OLD TABLE AS old_rows NEW TABLE AS new_rows',
+    ),
+]
+
+# SQLite has no statement-level triggers; these fire per row.
+SQLITE_TRIGGERS = {
+    'forum_thread_responses_insert': """
+CREATE TRIGGER IF NOT EXISTS forum_thread_responses_insert AFTER INSERT ON forum_forumresponse
+BEGIN
+    UPDATE forum_forumthread SET responses_count = responses_count + 1 WHERE id = NEW.thread_id;
+END
+""",
+    'forum_thread_responses_delete': """
+CREATE TRIGGER IF NOT EXISTS forum_thread_responses_delete AFTER DELETE ON forum_forumresponse
+BEGIN
+    UPDATE forum_forumthread SET responses_count = responses_count - 1
+    WHERE id = OLD.thread_id AND responses_count > 0;
+END
+""",
+    'forum_response_votes_insert': """
+CREATE TRIGGER IF NOT EXISTS forum_response_votes_insert AFTER INSERT ON forum_responsevote
+BEGIN
+    UPDATE forum_forumresponse SET
+        helpful_count = helpful_count + (NEW.vote_type = 'helpful'),
+        unhelpful_count = unhelpful_count + (NEW.vote_type = 'unhelpful')
+    WHERE id = NEW.response_id;
+END
+""",
+    'forum_response_votes_delete': """
+CREATE TRIGGER IF NOT EXISTS forum_response_votes_delete AFTER DELETE ON forum_responsevote
+BEGIN
+    UPDATE forum_forumresponse SET
+        helpful_count = max(helpful_count - (OLD.vote_type = 'helpful'), 0),
+        unhelpful_count = max(unhelpful_count - (OLD.vote_type = 'unhelpful'), 0)
+    WHERE id = OLD.response_id;
+END
+""",
+    'forum_response_votes_update': """
+CREATE TRIGGER IF NOT EXISTS forum_response_votes_update
+AFTER UPDATE OF vote_type, response_id ON forum_responsevote
+WHEN OLD.vote_type <> NEW.vote_type OR OLD.response_id <> NEW.response_id
+BEGIN
+    UPDATE forum_forumresponse SET
+        helpful_count = max(helpful_count - (OLD.vote_type = 'helpful'), 0),
+        unhelpful_count = max(unhelpful_count - (OLD.vote_type = 'unhelpful'), 0)
+    WHERE id = OLD.response_id;
+    UPDATE forum_forumresponse SET
+        helpful_count = helpful_count + (NEW.vote_type = 'helpful'),
+        unhelpful_count = unhelpful_count + (NEW.vote_type = 'unhelpful')
+    WHERE id = NEW.response_id;
+END
+""",
+}
+
+
+def create_counter_triggers(apps, schema_editor):
+    # Counters are kept by the database so bulk writes stay consistent.
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        for name, function, event, table, referencing in POSTGRESQL_TRIGGERS:
+            schema_editor.execute(function)
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {name} ON {table}')
+            schema_editor.execute(POSTGRESQL_TRIGGER.format(
+                name=name, event=event, table=table, referencing=referencing
+            ))
+    elif vendor == 'sqlite':
+        for sql in SQLITE_TRIGGERS.values():
+            schema_editor.execute(sql)
+
+
+def drop_counter_triggers(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        for name, _, _, table, _ in POSTGRESQL_TRIGGERS:
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {name} ON {table}')
+            schema_editor.execute(f'DROP FUNCTION IF EXISTS {name}()')
+    elif vendor == 'sqlite':
+        for name in SQLITE_TRIGGERS:
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forum', '0004_alter_responsevote_id'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_counter_triggers, drop_counter_triggers),
+    ]
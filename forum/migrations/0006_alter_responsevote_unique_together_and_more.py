@@ -0,0 +1,31 @@
+from importlib import import_module
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def reinstall_counter_triggers(apps, schema_editor):
+    # SQLite adds this constraint by rebuilding the table, which drops the
+    # vote counter triggers on it; their SQL is idempotent.
+    triggers = import_module('forum.migrations.0005_forum_counter_triggers')
+    triggers.create_counter_triggers(apps, schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forum', '0005_forum_counter_triggers'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='responsevote',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='responsevote',
+            constraint=models.UniqueConstraint(fields=('user', 'response'), name='uniq_user_response_vote'),
+        ),
+        migrations.RunPython(reinstall_counter_triggers, migrations.RunPython.noop),
+    ]
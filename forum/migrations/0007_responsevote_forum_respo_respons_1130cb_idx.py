@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-16 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forum', '0006_alter_responsevote_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='responsevote',
+            index=models.Index(fields=['response', 'vote_type'], name='forum_respo_respons_1130cb_idx'),
+        ),
+    ]
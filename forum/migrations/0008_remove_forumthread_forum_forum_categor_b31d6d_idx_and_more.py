@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-16 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forum', '0007_responsevote_forum_respo_respons_1130cb_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='forumthread',
+            name='forum_forum_categor_b31d6d_idx',
+        ),
+        migrations.AddIndex(
+            model_name='forumthread',
+            index=models.Index(fields=['-is_pinned', '-created_at'], name='forum_forum_is_pinn_15523a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='forumthread',
+            index=models.Index(fields=['category', '-is_pinned', '-created_at'], name='forum_forum_categor_b991ed_idx'),
+        ),
+    ]
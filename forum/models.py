@@ -1,7 +1,11 @@
 from django.db import models
+from django.utils import timezone
+from django.db.models.functions import Cast
 from django.core.validators import MinValueValidator, MaxValueValidator
 import uuid
-from users.models import CustomUser
+from mvpbackend.db import insert_unless_exists
+from mvpbackend.ids import uuid7
+from users.models import CustomUser, USER_LIST_COLUMNS
 
 
 class ForumCategory(models.Model):
@@ -27,6 +31,25 @@ class ForumCategory(models.Model):
         return self.name
 
 
+def percentage(part, total):
+    """Return part/total * 100 as a float expression, 0 when total is 0."""
+    return models.Case(
+        models.When(**{total: 0}, then=models.Value(0.0)),
+        default=Cast(part, models.FloatField()) * 100.0 / models.F(total),
+        output_field=models.FloatField()
+    )
+
+
+class ExpertVerificationQuerySet(models.QuerySet):
+    """QuerySet helpers for rendering expert verifications."""
+    
+    def with_helpfulness_rate(self):
+        """Annotate the helpfulness rate computed by get_helpfulness_rate."""
+        return self.annotate(
+            helpfulness_rate_annotated=percentage('helpful_responses', 'total_responses')
+        )
+
+
 class ExpertVerification(models.Model):
     """
     Track verified experts in the forum.
@@ -66,6 +89,8 @@ class ExpertVerification(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     verified_at = models.DateTimeField(null=True, blank=True)
     
+    objects = ExpertVerificationQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-verified_at']
     
@@ -126,7 +151,11 @@ class ForumThread(models.Model):
         ordering = ['-is_pinned', '-created_at']
         indexes = [
             models.Index(fields=['author', 'status']),
-            models.Index(fields=['category']),
+            models.Index(fields=['author', '-created_at']),
+            # Match Meta.ordering, alone and within a category, so list
+            # pages are read presorted
+            models.Index(fields=['-is_pinned', '-created_at']),
+            models.Index(fields=['category', '-is_pinned', '-created_at']),
             models.Index(fields=['car_make', 'car_model']),
         ]
     
@@ -135,10 +164,50 @@ class ForumThread(models.Model):
     
     def mark_as_resolved(self):
         """Mark thread as resolved."""
-        from django.utils import timezone
         self.status = 'resolved'
         self.resolved_at = timezone.now()
-        self.save()
+        # Leave the counters alone; they are updated in place by other requests
+        self.save(update_fields=['status', 'resolved_at', 'updated_at'])
+
+
+class ForumResponseQuerySet(models.QuerySet):
+    """QuerySet helpers for rendering forum responses."""
+    
+    LIST_FIELDS = (
+        'id', 'content', 'is_expert_response', 'is_ai_response', 'ai_confidence',
+        'helpful_count', 'unhelpful_count', 'is_approved', 'is_flagged',
+        'created_at', 'updated_at'
+    )
+    
+    def with_is_expert(self):
+        """Annotate whether each response's author is an approved expert."""
+        return self.annotate(
+            is_expert_annotated=models.Exists(
+                ExpertVerification.objects.filter(
+                    user=models.OuterRef('author'), status='approved'
+                )
+            )
+        )
+    
+    def with_helpfulness_score(self):
+        """Annotate the helpfulness score computed by get_helpfulness_score."""
+        return self.annotate(
+            vote_total=models.F('helpful_count') + models.F('unhelpful_count')
+        ).annotate(
+            helpfulness_score_annotated=percentage('helpful_count', 'vote_total')
+        )
+    
+    def list_values(self):
+        """
+        Return list-view rows as dicts with the author and annotations.
+        
+        Skips model instantiation; rows are rendered by ForumResponseListSerializer.
+        """
+        author_fields = [f'author__{name}' for name in USER_LIST_COLUMNS]
+        return self.with_is_expert().with_helpfulness_score().values(
+            *self.LIST_FIELDS, *author_fields,
+            'is_expert_annotated', 'helpfulness_score_annotated'
+        )
 
 
 class ForumResponse(models.Model):
@@ -179,10 +248,13 @@ class ForumResponse(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ForumResponseQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-is_expert_response', '-helpful_count', 'created_at']
         indexes = [
-            models.Index(fields=['thread', 'is_expert_response']),
+            # Matches Meta.ordering so a thread's responses come back presorted
+            models.Index(fields=['thread', '-is_expert_response', '-helpful_count', 'created_at']),
             models.Index(fields=['author']),
         ]
     
@@ -207,7 +279,7 @@ class ResponseVote(models.Model):
         ('unhelpful', 'Unhelpful'),
     )
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     response = models.ForeignKey(ForumResponse, on_delete=models.CASCADE, related_name='votes')
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='response_votes')
     
@@ -216,8 +288,34 @@ class ResponseVote(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
-        unique_together = ('response', 'user')
         ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'response'], name='uniq_user_response_vote'),
+        ]
+        indexes = [
+            models.Index(fields=['response', 'vote_type']),
+        ]
     
     def __str__(self):
         return f"{self.user.get_full_name()} - {self.vote_type} on response"
+    
+    @classmethod
+    def cast(cls, response, user, vote_type):
+        """
+        Record a user's vote on a response; return whether it was a new vote.
+        
+        New votes take a single INSERT ... ON CONFLICT DO NOTHING; an existing
+        vote is then switched with one conditional UPDATE.
+        """
+        created = insert_unless_exists(cls, {
+            'id': uuid7(),
+            'response': response.pk,
+            'user': user.pk,
+            'vote_type': vote_type,
+            'created_at': timezone.now(),
+        })
+        if not created:
+            cls.objects.filter(
+                response=response, user=user
+            ).exclude(vote_type=vote_type).update(vote_type=vote_type)
+        return created
@@ -2,7 +2,7 @@ from rest_framework import serializers
 from forum.models import (
     ForumCategory, ForumThread, ForumResponse, ExpertVerification, ResponseVote
 )
-from users.api.serializers import UserListSerializer
+from users.api.serializers import UserListRowSerializer, UserListSerializer
 
 
 class ForumCategorySerializer(serializers.ModelSerializer):
@@ -14,6 +14,36 @@ class ForumCategorySerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
+class ForumCategoryListSerializer(serializers.Serializer):
+    """
+    Read-only serializer for category list views.
+    
+    Renders .values() rows with the same output as ForumCategorySerializer,
+    so listing categories never builds model instances.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.icon_storage = ForumCategory._meta.get_field('icon').storage
+    
+    def get_icon_url(self, name):
+        """Build the icon URL the way DRF's ImageField does."""
+        if not name:
+            return None
+        url = self.icon_storage.url(name)
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+    
+    def to_representation(self, row):
+        return {
+            'id': str(row['id']),
+            'name': row['name'],
+            'description': row['description'],
+            'icon': self.get_icon_url(row['icon']),
+            'is_active': row['is_active'],
+        }
+
+
 class ExpertVerificationSerializer(serializers.ModelSerializer):
     """Serializer for expert verification."""
     
@@ -31,6 +61,9 @@ class ExpertVerificationSerializer(serializers.ModelSerializer):
     
     def get_helpfulness_rate(self, obj):
         """Get helpfulness rate."""
+        # Set by ExpertVerificationQuerySet.with_helpfulness_rate
+        if hasattr(obj, 'helpfulness_rate_annotated'):
+            return obj.helpfulness_rate_annotated
         return obj.get_helpfulness_rate()
 
 
@@ -66,11 +99,24 @@ class ForumResponseSerializer(serializers.ModelSerializer):
     
     def get_is_expert(self, obj):
         """Check if author is verified expert."""
-        return hasattr(obj.author, 'expert_verification') and \
-               obj.author.expert_verification.status == 'approved'
+        # Set by ForumResponseQuerySet.with_is_expert
+        if hasattr(obj, 'is_expert_annotated'):
+            return obj.is_expert_annotated
+        return ExpertVerification.objects.filter(
+            user_id=obj.author_id, status='approved'
+        ).exists()
     
     def get_user_vote(self, obj):
         """Get current user's vote on this response."""
+        # {response_id: vote_type} preloaded by the thread detail view
+        user_votes = self.context.get('user_votes')
+        if user_votes is not None:
+            return user_votes.get(obj.id)
+        
+        # The user's own votes, prefetched by ForumResponseViewSet
+        if hasattr(obj, 'user_vote_list'):
+            return obj.user_vote_list[0].vote_type if obj.user_vote_list else None
+        
         request = self.context.get('request')
         if not request or not request.user.is_authenticated:
             return None
@@ -82,9 +128,53 @@ class ForumResponseSerializer(serializers.ModelSerializer):
     
     def get_helpfulness_score(self, obj):
         """Get helpfulness score."""
+        # Set by ForumResponseQuerySet.with_helpfulness_score
+        if hasattr(obj, 'helpfulness_score_annotated'):
+            return obj.helpfulness_score_annotated
         return obj.get_helpfulness_score()
 
 
+class ForumResponseListSerializer(serializers.Serializer):
+    """
+    Read-only serializer for response list views.
+    
+    Renders the dict rows of ForumResponseQuerySet.list_values with the same
+    output as ForumResponseSerializer. user_vote is looked up in the
+    'user_votes' context mapping of response id to vote type.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Built once and reused for every row
+        self.ai_confidence_field = serializers.DecimalField(max_digits=3, decimal_places=2)
+        self.datetime_field = serializers.DateTimeField()
+        self.author_serializer = UserListRowSerializer(prefix='author__')
+        self.author_serializer.bind('author', self)
+    
+    def to_representation(self, row):
+        ai_confidence = row['ai_confidence']
+        return {
+            'id': str(row['id']),
+            'author': self.author_serializer.to_representation(row),
+            'content': row['content'],
+            'is_expert_response': row['is_expert_response'],
+            'is_ai_response': row['is_ai_response'],
+            'ai_confidence': (
+                None if ai_confidence is None
+                else self.ai_confidence_field.to_representation(ai_confidence)
+            ),
+            'helpful_count': row['helpful_count'],
+            'unhelpful_count': row['unhelpful_count'],
+            'is_approved': row['is_approved'],
+            'is_flagged': row['is_flagged'],
+            'created_at': self.datetime_field.to_representation(row['created_at']),
+            'updated_at': self.datetime_field.to_representation(row['updated_at']),
+            'is_expert': row['is_expert_annotated'],
+            'user_vote': self.context.get('user_votes', {}).get(row['id']),
+            'helpfulness_score': row['helpfulness_score_annotated'],
+        }
+
+
 class ForumThreadListSerializer(serializers.ModelSerializer):
     """Serializer for forum thread list view."""
     
@@ -108,7 +198,7 @@ class ForumThreadDetailSerializer(serializers.ModelSerializer):
     
     author = UserListSerializer(read_only=True)
     category = ForumCategorySerializer(read_only=True)
-    responses = ForumResponseSerializer(many=True, read_only=True)
+    responses = serializers.SerializerMethodField()
     
     class Meta:
         model = ForumThread
@@ -122,6 +212,20 @@ class ForumThreadDetailSerializer(serializers.ModelSerializer):
             'id', 'author', 'views_count', 'responses_count', 'created_at',
             'updated_at', 'resolved_at'
         ]
+    
+    def get_responses(self, obj):
+        """Render the thread's responses from plain rows."""
+        rows = ForumResponse.objects.filter(thread=obj).list_values()
+        context = self.context
+        request = context.get('request')
+        if 'user_votes' not in context and request and request.user.is_authenticated:
+            # The user's votes on this thread, loaded once for every response
+            context = {**context, 'user_votes': dict(
+                ResponseVote.objects.filter(
+                    user=request.user, response__thread=obj
+                ).values_list('response_id', 'vote_type')
+            )}
+        return ForumResponseListSerializer(rows, many=True, context=context).data
 
 
 class ForumThreadCreateUpdateSerializer(serializers.ModelSerializer):
@@ -137,6 +241,13 @@ class ForumThreadCreateUpdateSerializer(serializers.ModelSerializer):
         """Create thread with author from request user."""
         validated_data['author'] = self.context['request'].user
         return super().create(validated_data)
+    
+    def update(self, instance, validated_data):
+        """Save only the edited fields so stale counters are not written back."""
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        return instance
 
 
 class ForumResponseCreateSerializer(serializers.ModelSerializer):
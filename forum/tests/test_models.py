@@ -9,8 +9,9 @@ User = get_user_model()
 class ForumCategoryModelTest(TestCase):
     """Test suite for ForumCategory model"""
 
-    def setUp(self):
-        self.category = ForumCategory.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = ForumCategory.objects.create(
             name="General Discussion",
             description="General automotive discussions"
         )
@@ -41,19 +42,20 @@ class ForumCategoryModelTest(TestCase):
 class ForumThreadModelTest(TestCase):
     """Test suite for ForumThread model"""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email="testuser@example.com",
             password="testpass123",
             first_name="Test", last_name="User"
         )
-        self.category = ForumCategory.objects.create(
+        cls.category = ForumCategory.objects.create(
             name="Technical Help",
             description="Get technical help"
         )
-        self.thread = ForumThread.objects.create(
-            author=self.user,
-            category=self.category,
+        cls.thread = ForumThread.objects.create(
+            author=cls.user,
+            category=cls.category,
             title="Engine problem help",
             description="My engine makes a strange noise",
             car_make="Toyota",
@@ -106,29 +108,39 @@ class ForumThreadModelTest(TestCase):
         self.assertEqual(self.thread.status, "resolved")
         self.assertIsNotNone(self.thread.resolved_at)
 
+    def test_mark_as_resolved_keeps_counters(self):
+        """Test that resolving does not write back stale counters"""
+        ForumThread.objects.filter(id=self.thread.id).update(views_count=5)
+        self.thread.mark_as_resolved()
+
+        self.thread.refresh_from_db()
+        self.assertEqual(self.thread.status, "resolved")
+        self.assertEqual(self.thread.views_count, 5)
+
 
 class ForumResponseModelTest(TestCase):
     """Test suite for ForumResponse model"""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email="responder@example.com",
             password="pass123",
             first_name="Response", last_name="User"
         )
-        self.category = ForumCategory.objects.create(
+        cls.category = ForumCategory.objects.create(
             name="Help",
             description="Help category"
         )
-        self.thread = ForumThread.objects.create(
-            author=self.user,
-            category=self.category,
+        cls.thread = ForumThread.objects.create(
+            author=cls.user,
+            category=cls.category,
             title="Need help",
             description="Need help with something"
         )
-        self.response = ForumResponse.objects.create(
-            thread=self.thread,
-            author=self.user,
+        cls.response = ForumResponse.objects.create(
+            thread=cls.thread,
+            author=cls.user,
             content="Here's my suggestion..."
         )
 
@@ -165,6 +177,49 @@ class ForumResponseModelTest(TestCase):
         score = self.response.get_helpfulness_score()
         self.assertEqual(score, 0)
 
+    def test_helpfulness_score_annotation(self):
+        """Test that the annotated score matches get_helpfulness_score"""
+        response = ForumResponse.objects.with_helpfulness_score().get(id=self.response.id)
+        self.assertEqual(response.helpfulness_score_annotated, 0)
+
+        ForumResponse.objects.filter(id=self.response.id).update(helpful_count=3, unhelpful_count=1)
+        response = ForumResponse.objects.with_helpfulness_score().get(id=self.response.id)
+        self.assertEqual(response.helpfulness_score_annotated, response.get_helpfulness_score())
+
+    def test_with_is_expert_annotation(self):
+        """Test that responses are flagged only for approved experts"""
+        verification = ExpertVerification.objects.create(
+            user=self.user,
+            years_of_experience=5,
+            bio="Mechanic"
+        )
+        response = ForumResponse.objects.with_is_expert().get(id=self.response.id)
+        self.assertFalse(response.is_expert_annotated)
+
+        verification.status = "approved"
+        verification.save()
+        response = ForumResponse.objects.with_is_expert().get(id=self.response.id)
+        self.assertTrue(response.is_expert_annotated)
+
+    def test_thread_responses_count_tracks_responses(self):
+        """Test that the thread's response count follows creates and deletes"""
+        extra = ForumResponse.objects.create(thread=self.thread, author=self.user, content="More")
+        self.thread.refresh_from_db()
+        self.assertEqual(self.thread.responses_count, 2)
+
+        extra.delete()
+        self.thread.refresh_from_db()
+        self.assertEqual(self.thread.responses_count, 1)
+
+    def test_thread_responses_count_tracks_bulk_create(self):
+        """Test that bulk-created responses are counted on the thread"""
+        ForumResponse.objects.bulk_create([
+            ForumResponse(thread=self.thread, author=self.user, content=f"Bulk {i}")
+            for i in range(3)
+        ])
+        self.thread.refresh_from_db()
+        self.assertEqual(self.thread.responses_count, 4)
+
     def test_response_cascade_delete(self):
         """Test that responses are deleted when thread is deleted"""
         thread_id = self.thread.id
@@ -175,14 +230,15 @@ class ForumResponseModelTest(TestCase):
 class ExpertVerificationModelTest(TestCase):
     """Test suite for ExpertVerification model"""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email="expert@example.com",
             password="pass123",
             first_name="Expert", last_name="User"
         )
-        self.verification = ExpertVerification.objects.create(
-            user=self.user,
+        cls.verification = ExpertVerification.objects.create(
+            user=cls.user,
             expertise_areas=["Engine Repair", "Electrical Systems"],
             years_of_experience=10,
             bio="Experienced mechanic"
@@ -216,22 +272,23 @@ class ExpertVerificationModelTest(TestCase):
 class ResponseVoteModelTest(TestCase):
     """Test suite for ResponseVote model"""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email="voter@example.com",
             password="pass123",
             first_name="Voter", last_name="User"
         )
-        self.category = ForumCategory.objects.create(name="Test")
-        self.thread = ForumThread.objects.create(
-            author=self.user,
-            category=self.category,
+        cls.category = ForumCategory.objects.create(name="Test")
+        cls.thread = ForumThread.objects.create(
+            author=cls.user,
+            category=cls.category,
             title="Test",
             description="Test"
         )
-        self.response = ForumResponse.objects.create(
-            thread=self.thread,
-            author=self.user,
+        cls.response = ForumResponse.objects.create(
+            thread=cls.thread,
+            author=cls.user,
             content="Test response"
         )
 
@@ -269,3 +326,32 @@ class ResponseVoteModelTest(TestCase):
                 user=self.user,
                 vote_type="unhelpful"
             )
+
+    def test_cast_creates_then_switches_vote(self):
+        """Test that cast inserts a new vote and switches an existing one"""
+        self.assertTrue(ResponseVote.cast(self.response, self.user, "helpful"))
+        self.assertFalse(ResponseVote.cast(self.response, self.user, "unhelpful"))
+
+        vote = ResponseVote.objects.get(response=self.response, user=self.user)
+        self.assertEqual(vote.vote_type, "unhelpful")
+        self.response.refresh_from_db()
+        self.assertEqual((self.response.helpful_count, self.response.unhelpful_count), (0, 1))
+
+    def test_vote_counts_follow_changes(self):
+        """Test that response counters follow vote creates, changes and deletes"""
+        vote = ResponseVote.objects.create(
+            response=self.response,
+            user=self.user,
+            vote_type="helpful"
+        )
+        self.response.refresh_from_db()
+        self.assertEqual((self.response.helpful_count, self.response.unhelpful_count), (1, 0))
+
+        vote.vote_type = "unhelpful"
+        vote.save()
+        self.response.refresh_from_db()
+        self.assertEqual((self.response.helpful_count, self.response.unhelpful_count), (0, 1))
+
+        vote.delete()
+        self.response.refresh_from_db()
+        self.assertEqual((self.response.helpful_count, self.response.unhelpful_count), (0, 0))
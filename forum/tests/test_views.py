@@ -1,6 +1,10 @@
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from forum.models import ForumCategory, ForumThread, ForumResponse, ResponseVote
 from rest_framework_simplejwt.tokens import RefreshToken
 
@@ -10,17 +14,20 @@ User = get_user_model()
 class ForumThreadAPITest(APITestCase):
     """Test suite for ForumThread API endpoints"""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email="testuser@example.com",
             password="testpass123",
             first_name="Test", last_name="User"
         )
-        self.category = ForumCategory.objects.create(
+        cls.category = ForumCategory.objects.create(
             name="General",
             description="General category"
         )
+
+    def setUp(self):
+        self.client = APIClient()
         
         # Get JWT token
         refresh = RefreshToken.for_user(self.user)
@@ -42,14 +49,22 @@ class ForumThreadAPITest(APITestCase):
             description="Description 2"
         )
         
-        response = self.client.get('/api/forum/threads/')
+        # Auth and one SELECT joining author and category
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/forum/threads/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertLessEqual(len(queries), 5)
+        
+        # A short first page is counted from its rows
+        self.assertEqual(response.data['count'], 2)
+        self.assertFalse(any('COUNT(' in query['sql'] for query in queries))
         
         if 'results' in response.data:
             self.assertEqual(len(response.data['results']), 2)
         else:
             self.assertEqual(len(response.data), 2)
 
+    @override_settings(FORUM_VIEW_FLUSH_EVERY=2)
     def test_retrieve_thread_increments_views(self):
         """Test that retrieving a thread increments view count"""
         thread = ForumThread.objects.create(
@@ -62,9 +77,57 @@ class ForumThreadAPITest(APITestCase):
         
         response = self.client.get(f'/api/forum/threads/{thread.id}/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['views_count'], initial_views + 1)
+        
+        # Buffered until a full batch is written back
+        thread.refresh_from_db()
+        self.assertEqual(thread.views_count, initial_views)
+        
+        response = self.client.get(f'/api/forum/threads/{thread.id}/')
+        self.assertEqual(response.data['views_count'], initial_views + 2)
+        thread.refresh_from_db()
+        self.assertEqual(thread.views_count, initial_views + 2)
+
+    @override_settings(FORUM_VIEW_FLUSH_EVERY=1)
+    def test_retrieve_thread_writes_views_without_buffer(self):
+        """Test that views are written straight through when not buffered"""
+        thread = ForumThread.objects.create(
+            author=self.user,
+            category=self.category,
+            title="Unbuffered View Test",
+            description="Test description"
+        )
         
+        response = self.client.get(f'/api/forum/threads/{thread.id}/')
+        self.assertEqual(response.data['views_count'], 1)
         thread.refresh_from_db()
-        self.assertEqual(thread.views_count, initial_views + 1)
+        self.assertEqual(thread.views_count, 1)
+
+    def test_retrieve_thread_queries_do_not_grow_with_responses(self):
+        """Test that thread detail does not query per response"""
+        thread = ForumThread.objects.create(
+            author=self.user,
+            category=self.category,
+            title="Query Count Test",
+            description="Test description"
+        )
+        ForumResponse.objects.create(thread=thread, author=self.user, content="First")
+        
+        with CaptureQueriesContext(connection) as one_response:
+            self.client.get(f'/api/forum/threads/{thread.id}/')
+        
+        for i in range(3):
+            author = User.objects.create_user(
+                email=f"responder{i}@example.com",
+                password="testpass123",
+                first_name="Responder", last_name=str(i)
+            )
+            ForumResponse.objects.create(thread=thread, author=author, content=f"Reply {i}")
+        
+        with CaptureQueriesContext(connection) as four_responses:
+            response = self.client.get(f'/api/forum/threads/{thread.id}/')
+        self.assertEqual(len(response.data['responses']), 4)
+        self.assertEqual(len(four_responses), len(one_response))
 
     def test_create_thread_authenticated(self):
         """Test creating a thread when authenticated"""
@@ -97,28 +160,68 @@ class ForumThreadAPITest(APITestCase):
         response = self.client.post('/api/forum/threads/', data, format='json')
         self.assertIn(response.status_code, [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN])
 
+    def test_list_threads_filtered_by_author_me(self):
+        """Test that author=me limits the list to the user's own threads"""
+        other = User.objects.create_user(
+            email="other@example.com",
+            password="testpass123",
+            first_name="Other", last_name="User"
+        )
+        mine = ForumThread.objects.create(
+            author=self.user, category=self.category, title="Mine", description="Mine"
+        )
+        ForumThread.objects.create(
+            author=other, category=self.category, title="Theirs", description="Theirs"
+        )
+        
+        response = self.client.get('/api/forum/threads/?author=me')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row['id'] for row in response.data['results']], [str(mine.id)])
+
+    def test_mark_resolved_returns_slim_payload(self):
+        """Test that mark_resolved returns the new state unless full=1 is passed"""
+        thread = ForumThread.objects.create(
+            author=self.user,
+            category=self.category,
+            title="Resolvable Thread",
+            description="Description"
+        )
+        response_obj = ForumResponse.objects.create(thread=thread, author=self.user, content="Answer")
+        ResponseVote.objects.create(response=response_obj, user=self.user, vote_type='helpful')
+        url = f'/api/forum/threads/{thread.id}/mark_resolved/'
+        
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['thread']['status'], 'resolved')
+        self.assertNotIn('responses', response.data['thread'])
+        
+        response = self.client.post(f'{url}?full=1')
+        self.assertEqual(response.data['thread']['responses'][0]['user_vote'], 'helpful')
+
 
 class ForumResponseAPITest(APITestCase):
     """Test suite for ForumResponse API endpoints"""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email="responseuser@example.com",
             password="pass123",
             first_name="Response", last_name="User"
         )
-        self.category = ForumCategory.objects.create(
+        cls.category = ForumCategory.objects.create(
             name="Discussion",
             description="Discussion category"
         )
-        self.thread = ForumThread.objects.create(
-            author=self.user,
-            category=self.category,
+        cls.thread = ForumThread.objects.create(
+            author=cls.user,
+            category=cls.category,
             title="Response Test Thread",
             description="Test description"
         )
-        
+
+    def setUp(self):
+        self.client = APIClient()
         refresh = RefreshToken.for_user(self.user)
         self.token = str(refresh.access_token)
         self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
@@ -136,12 +239,36 @@ class ForumResponseAPITest(APITestCase):
             content="Response 2"
         )
         
-        response = self.client.get(f'/api/forum/responses/?thread={self.thread.id}')
+        # Auth, the responses and one prefetch of the user's votes
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'/api/forum/responses/?thread={self.thread.id}')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertLessEqual(len(queries), 5)
         
         responses = response.data.get('results', response.data)
         self.assertEqual(len(responses), 2)
 
+    def test_anonymous_response_list_cache_is_retired_on_write(self):
+        """Test that cached anonymous response lists are dropped when responses change"""
+        ForumResponse.objects.create(thread=self.thread, author=self.user, content="First")
+        anonymous = APIClient()
+        url = f'/api/forum/responses/?thread={self.thread.id}'
+        
+        response = anonymous.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+        
+        # Served from the cache until a response is written through the API
+        ForumResponse.objects.create(thread=self.thread, author=self.user, content="Direct")
+        self.assertEqual(len(anonymous.get(url).data['results']), 1)
+        
+        self.client.post(
+            f'/api/forum/threads/{self.thread.id}/add_response/',
+            {'content': 'Via the API'},
+            format='json'
+        )
+        self.assertEqual(len(anonymous.get(url).data['results']), 3)
+
     def test_add_response_to_thread(self):
         """Test adding a response using the add_response action"""
         data = {'content': 'This is my response'}
@@ -187,6 +314,83 @@ class ForumResponseAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(ResponseVote.objects.filter(response=response_obj).count(), 1)
 
+    def test_switch_vote(self):
+        """Test that voting the other way moves the vote between counters"""
+        response_obj = ForumResponse.objects.create(
+            thread=self.thread,
+            author=self.user,
+            content="Votable response"
+        )
+        ResponseVote.objects.create(response=response_obj, user=self.user, vote_type='helpful')
+        
+        response = self.client.post(
+            f'/api/forum/responses/{response_obj.id}/vote/',
+            {'vote_type': 'unhelpful'},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['message'], 'Vote updated')
+        self.assertEqual(response.data['response']['user_vote'], 'unhelpful')
+        response_obj.refresh_from_db()
+        self.assertEqual((response_obj.helpful_count, response_obj.unhelpful_count), (0, 1))
+
+    def test_my_responses_queries_do_not_grow_with_votes(self):
+        """Test that my_responses loads the user's votes in one query"""
+        first = ForumResponse.objects.create(thread=self.thread, author=self.user, content="First")
+        ResponseVote.objects.create(response=first, user=self.user, vote_type='helpful')
+        
+        with CaptureQueriesContext(connection) as one_response:
+            self.client.get('/api/forum/responses/my_responses/')
+        
+        for i in range(3):
+            response_obj = ForumResponse.objects.create(
+                thread=self.thread, author=self.user, content=f"Reply {i}"
+            )
+            ResponseVote.objects.create(response=response_obj, user=self.user, vote_type='unhelpful')
+        
+        with CaptureQueriesContext(connection) as four_responses:
+            response = self.client.get('/api/forum/responses/my_responses/')
+        votes = sorted(row['user_vote'] for row in response.data['results'])
+        self.assertEqual(votes, ['helpful', 'unhelpful', 'unhelpful', 'unhelpful'])
+        self.assertEqual(len(four_responses), len(one_response))
+
+    def test_cached_thread_detail_follows_votes(self):
+        """Test that a vote retires the cached thread detail and shows the user's vote"""
+        response_obj = ForumResponse.objects.create(
+            thread=self.thread,
+            author=self.user,
+            content="Votable response"
+        )
+        url = f'/api/forum/threads/{self.thread.id}/'
+        self.assertIsNone(self.client.get(url).data['responses'][0]['user_vote'])
+        
+        self.client.post(
+            f'/api/forum/responses/{response_obj.id}/vote/',
+            {'vote_type': 'helpful'},
+            format='json'
+        )
+        row = self.client.get(url).data['responses'][0]
+        self.assertEqual((row['helpful_count'], row['user_vote']), (1, 'helpful'))
+        
+        # Other users share the cached payload without this user's vote
+        self.assertIsNone(APIClient().get(url).data['responses'][0]['user_vote'])
+
+    def test_list_rows_match_detail_serializer(self):
+        """Test that list rows render the same fields as a single response"""
+        response_obj = ForumResponse.objects.create(
+            thread=self.thread,
+            author=self.user,
+            content="Rendered twice",
+            is_ai_response=True,
+            ai_confidence="0.85"
+        )
+        ResponseVote.objects.create(response=response_obj, user=self.user, vote_type='helpful')
+        
+        listed = self.client.get(f'/api/forum/responses/?thread={self.thread.id}').data['results'][0]
+        detail = self.client.get(f'/api/forum/responses/{response_obj.id}/').data
+        self.assertEqual(listed, dict(detail))
+
     def test_remove_vote(self):
         """Test removing a vote from a response"""
         response_obj = ForumResponse.objects.create(
@@ -208,22 +412,28 @@ class ForumResponseAPITest(APITestCase):
 class ForumCategoryAPITest(APITestCase):
     """Test suite for ForumCategory API endpoints"""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email="catuser@example.com",
             password="pass123",
             first_name="Category", last_name="User"
         )
-        
+
+    def setUp(self):
+        # The category list is cached under one key shared by every test
+        cache.clear()
+        self.client = APIClient()
         refresh = RefreshToken.for_user(self.user)
         self.token = str(refresh.access_token)
         self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
 
     def test_list_categories(self):
         """Test listing forum categories"""
-        ForumCategory.objects.create(name="Category 1", description="Desc 1")
-        ForumCategory.objects.create(name="Category 2", description="Desc 2")
+        ForumCategory.objects.bulk_create([
+            ForumCategory(name="Category 1", description="Desc 1"),
+            ForumCategory(name="Category 2", description="Desc 2"),
+        ])
         
         response = self.client.get('/api/forum/categories/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -233,8 +443,10 @@ class ForumCategoryAPITest(APITestCase):
 
     def test_filter_active_categories(self):
         """Test that only active categories are listed"""
-        ForumCategory.objects.create(name="Active", description="Active cat", is_active=True)
-        ForumCategory.objects.create(name="Inactive", description="Inactive cat", is_active=False)
+        ForumCategory.objects.bulk_create([
+            ForumCategory(name="Active", description="Active cat", is_active=True),
+            ForumCategory(name="Inactive", description="Inactive cat", is_active=False),
+        ])
         
         response = self.client.get('/api/forum/categories/')
         categories = response.data if isinstance(response.data, list) else response.data.get('results', [])
@@ -242,3 +454,15 @@ class ForumCategoryAPITest(APITestCase):
         # Assuming the view filters by is_active=True
         active_names = [cat['name'] for cat in categories if 'name' in cat]
         self.assertIn('Active', active_names)
+
+    def test_category_list_cache_is_dropped_on_save(self):
+        """Test that the cached category list is refreshed when a category is saved"""
+        ForumCategory.objects.create(name="First", description="First cat")
+        self.assertEqual(len(self.client.get('/api/forum/categories/').data), 1)
+        
+        anonymous = APIClient()
+        with self.assertNumQueries(0):
+            anonymous.get('/api/forum/categories/')
+        
+        ForumCategory.objects.create(name="Second", description="Second cat")
+        self.assertEqual(len(self.client.get('/api/forum/categories/').data), 2)
@@ -0,0 +1,10 @@
+from rest_framework.routers import SimpleRouter
+from forum.views import ForumThreadViewSet, ForumResponseViewSet, ExpertVerificationViewSet, ForumCategoryViewSet
+
+router = SimpleRouter()
+router.register(r'forum/categories', ForumCategoryViewSet, basename='forum-category')
+router.register(r'forum/threads', ForumThreadViewSet, basename='forum-thread')
+router.register(r'forum/responses', ForumResponseViewSet, basename='forum-response')
+router.register(r'forum/experts', ExpertVerificationViewSet, basename='expert-verification')
+
+urlpatterns = router.urls
@@ -1,24 +1,75 @@
 from rest_framework import viewsets, status, permissions, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
-from django.db.models import Q
+from rest_framework.pagination import CursorPagination
+from rest_framework.settings import api_settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Prefetch, Q
 from django.utils import timezone
+from django_filters.rest_framework import DjangoFilterBackend
+from forum.cache import (
+    CATEGORY_LIST_CACHE_TIMEOUT, CATEGORY_LIST_KEY, RESPONSE_LIST_CACHE_TIMEOUT,
+    THREAD_DETAIL_CACHE_TIMEOUT, invalidate_response_list, record_thread_view,
+    response_list_key, thread_detail_key
+)
+from forum.filters import ForumThreadFilter
 from forum.models import (
     ForumCategory, ForumThread, ForumResponse, ExpertVerification, ResponseVote
 )
 from forum.serializers import (
-    ForumCategorySerializer, ForumThreadListSerializer, ForumThreadDetailSerializer,
-    ForumThreadCreateUpdateSerializer, ForumResponseSerializer, ForumResponseCreateSerializer,
-    ExpertVerificationSerializer, ExpertVerificationRequestSerializer
+    ForumCategorySerializer, ForumCategoryListSerializer, ForumThreadListSerializer,
+    ForumThreadDetailSerializer, ForumThreadCreateUpdateSerializer, ForumResponseSerializer,
+    ForumResponseListSerializer, ForumResponseCreateSerializer, ExpertVerificationSerializer,
+    ExpertVerificationRequestSerializer
 )
+from mvpbackend.pagination import CachedCountPagination
+from users.api.serializers import USER_LIST_COLUMNS
+
+
+# Columns rendered by ForumThreadListSerializer; description is skipped
+THREAD_LIST_COLUMNS = (
+    'id', 'author', 'category', 'title', 'car_make', 'car_model', 'car_year',
+    'status', 'is_pinned', 'is_featured', 'views_count', 'responses_count',
+    'created_at', 'resolved_at',
+    *[f'author__{name}' for name in USER_LIST_COLUMNS],
+    'category__id', 'category__name', 'category__description',
+    'category__icon', 'category__is_active'
+)
+
+# Columns rendered by ForumResponseSerializer
+RESPONSE_COLUMNS = (
+    'id', 'author', 'content', 'is_expert_response', 'is_ai_response',
+    'ai_confidence', 'helpful_count', 'unhelpful_count', 'is_approved',
+    'is_flagged', 'created_at', 'updated_at',
+    *[f'author__{name}' for name in USER_LIST_COLUMNS]
+)
+
+
+class StandardResultsSetPagination(CachedCountPagination):
+    """Standard pagination for forum; later pages reuse the first page's count."""
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    count_cache_prefix = 'forumcount'
 
 
-class StandardResultsSetPagination(PageNumberPagination):
-    """Standard pagination for forum."""
+class ThreadCursorPagination(CursorPagination):
+    """
+    Keyset pagination for per-user thread listings, newest first.
+    
+    Pages seek on created_at instead of using OFFSET. The main thread list
+    keeps page numbers: its pinned-first ordering has no unique leading
+    column to seek on.
+    """
+    ordering = '-created_at'
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 100
+    
+    def get_ordering(self, request, queryset, view):
+        # Ignore the viewset's OrderingFilter default, which leads with is_pinned
+        return (self.ordering,)
 
 
 class IsOwnerOrReadOnly(permissions.BasePermission):
@@ -38,6 +89,34 @@ class ForumCategoryViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     filter_backends = [filters.SearchFilter]
     search_fields = ['name', 'description']
+    
+    def get_queryset(self):
+        """List plain rows; retrieve keeps model instances."""
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            return queryset.values('id', 'name', 'description', 'icon', 'is_active')
+        return queryset
+    
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return ForumCategoryListSerializer
+        return ForumCategorySerializer
+    
+    def list(self, request, *args, **kwargs):
+        """
+        List active categories.
+        
+        The unfiltered list changes rarely, so its rows are cached until a
+        category is saved or deleted; searches still go to the database.
+        """
+        if request.query_params.get(api_settings.SEARCH_PARAM):
+            return super().list(request, *args, **kwargs)
+        
+        rows = cache.get_or_set(
+            CATEGORY_LIST_KEY, lambda: list(self.get_queryset()), CATEGORY_LIST_CACHE_TIMEOUT
+        )
+        serializer = self.get_serializer(rows, many=True)
+        return Response(serializer.data)
 
 
 class ForumThreadViewSet(viewsets.ModelViewSet):
@@ -56,11 +135,22 @@ class ForumThreadViewSet(viewsets.ModelViewSet):
     queryset = ForumThread.objects.all()
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsOwnerOrReadOnly]
     pagination_class = StandardResultsSetPagination
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filterset_class = ForumThreadFilter
     search_fields = ['title', 'description', 'car_make', 'car_model']
     ordering_fields = ['created_at', 'responses_count', 'views_count']
     ordering = ['-is_pinned', '-created_at']
     
+    @property
+    def paginator(self):
+        """Use keyset pagination for my_threads."""
+        if not hasattr(self, '_paginator'):
+            if self.action == 'my_threads':
+                self._paginator = ThreadCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+    
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
         if self.action == 'retrieve':
@@ -71,7 +161,15 @@ class ForumThreadViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Filter queryset based on status."""
-        return self.queryset.select_related('author', 'category').prefetch_related('responses')
+        queryset = self.queryset.select_related('author', 'category')
+        if self.action == 'my_threads':
+            queryset = queryset.filter(author=self.request.user)
+        elif self.action == 'by_category':
+            queryset = queryset.filter(category_id=self.request.query_params['category_id'])
+        if self.action in ('list', 'my_threads', 'by_category'):
+            return queryset.only(*THREAD_LIST_COLUMNS)
+        # Detail responses are rendered from plain rows by the serializer
+        return queryset
     
     def create(self, request, *args, **kwargs):
         """Create a new forum thread."""
@@ -89,13 +187,39 @@ class ForumThreadViewSet(viewsets.ModelViewSet):
         serializer.save(author=self.request.user)
     
     def retrieve(self, request, *args, **kwargs):
-        """Retrieve thread and increment view count."""
+        """
+        Retrieve thread and increment view count.
+        
+        The detail is rendered without per-user state and cached until the
+        thread or its responses change; the view count and the user's own
+        votes are laid over the cached payload.
+        """
         instance = self.get_object()
-        instance.views_count += 1
-        instance.save(update_fields=['views_count'])
+        # Buffered; shown counts include views not yet written back
+        instance.views_count += record_thread_view(instance.pk)
         
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        key = thread_detail_key(instance, request.build_absolute_uri())
+        payload = cache.get(key)
+        if payload is None:
+            context = {**self.get_serializer_context(), 'user_votes': {}}
+            payload = self.get_serializer(instance, context=context).data
+            cache.set(key, payload, THREAD_DETAIL_CACHE_TIMEOUT)
+        
+        payload = {**payload, 'views_count': instance.views_count}
+        if request.user.is_authenticated:
+            # Load the user's votes on this thread once instead of per response
+            user_votes = {
+                str(response_id): vote_type
+                for response_id, vote_type in ResponseVote.objects.filter(
+                    user=request.user, response__thread=instance
+                ).values_list('response_id', 'vote_type')
+            }
+            if user_votes:
+                payload['responses'] = [
+                    {**row, 'user_vote': user_votes.get(row['id'])}
+                    for row in payload['responses']
+                ]
+        return Response(payload)
     
     @action(detail=True, methods=['post'])
     def mark_resolved(self, request, pk=None):
@@ -110,8 +234,20 @@ class ForumThreadViewSet(viewsets.ModelViewSet):
             )
         
         thread.mark_as_resolved()
+        
+        # The full detail payload, with every response, is opt-in; most
+        # clients only need the new state
+        if request.query_params.get('full') == '1':
+            thread_data = ForumThreadDetailSerializer(thread, context=self.get_serializer_context()).data
+        else:
+            thread_data = {
+                'id': thread.id,
+                'status': thread.status,
+                'resolved_at': thread.resolved_at,
+                'updated_at': thread.updated_at,
+            }
         return Response(
-            {'message': 'Thread marked as resolved', 'thread': ForumThreadDetailSerializer(thread).data},
+            {'message': 'Thread marked as resolved', 'thread': thread_data},
             status=status.HTTP_200_OK
         )
     
@@ -125,7 +261,8 @@ class ForumThreadViewSet(viewsets.ModelViewSet):
             context={'request': request, 'thread': thread}
         )
         serializer.is_valid(raise_exception=True)
-        response = serializer.save()  # Signal will update thread.responses_count automatically
+        response = serializer.save()  # Trigger updates thread.responses_count
+        invalidate_response_list(thread.id)
         
         return Response(
             ForumResponseSerializer(response).data,
@@ -134,42 +271,23 @@ class ForumThreadViewSet(viewsets.ModelViewSet):
     
     @action(detail=False, methods=['get'])
     def my_threads(self, request):
-        """Get current user's threads."""
+        """Get current user's threads; same as listing with author=me."""
         if not request.user.is_authenticated:
             return Response(
                 {'error': 'Authentication required'},
                 status=status.HTTP_401_UNAUTHORIZED
             )
-        
-        queryset = ForumThread.objects.filter(author=request.user).select_related('author', 'category')
-        page = self.paginate_queryset(queryset)
-        
-        if page is not None:
-            serializer = ForumThreadListSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = ForumThreadListSerializer(queryset, many=True)
-        return Response(serializer.data)
+        return self.list(request)
     
     @action(detail=False, methods=['get'])
     def by_category(self, request):
-        """Get threads by category."""
-        category_id = request.query_params.get('category_id')
-        if not category_id:
+        """Get threads by category; same as listing with category=<id>."""
+        if not request.query_params.get('category_id'):
             return Response(
                 {'error': 'category_id parameter required'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        
-        queryset = ForumThread.objects.filter(category_id=category_id).select_related('author', 'category')
-        page = self.paginate_queryset(queryset)
-        
-        if page is not None:
-            serializer = ForumThreadListSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = ForumThreadListSerializer(queryset, many=True)
-        return Response(serializer.data)
+        return self.list(request)
 
 
 class ForumResponseViewSet(viewsets.ModelViewSet):
@@ -196,16 +314,84 @@ class ForumResponseViewSet(viewsets.ModelViewSet):
         
         # Non-staff users only see approved responses or their own
         if not self.request.user.is_staff:
-            queryset = queryset.filter(
-                Q(is_approved=True) | Q(author=self.request.user)
-            )
+            visible = Q(is_approved=True)
+            if self.request.user.is_authenticated:
+                visible |= Q(author=self.request.user)
+            queryset = queryset.filter(visible)
         
         # Filter by thread if provided
         thread_id = self.request.query_params.get('thread')
         if thread_id:
             queryset = queryset.filter(thread_id=thread_id)
         
-        return queryset.select_related('author', 'thread').prefetch_related('votes')
+        if self.action in ('list', 'my_responses'):
+            return queryset.list_values()
+        
+        queryset = queryset.select_related(
+            'author'
+        ).with_is_expert().with_helpfulness_score()
+        if self.action == 'retrieve':
+            queryset = queryset.only(*RESPONSE_COLUMNS)
+        if self.action == 'retrieve' and self.request.user.is_authenticated:
+            # Only the requesting user's votes are rendered
+            queryset = queryset.prefetch_related(Prefetch(
+                'votes',
+                queryset=ResponseVote.objects.filter(user=self.request.user).only('response', 'vote_type'),
+                to_attr='user_vote_list'
+            ))
+        return queryset
+    
+    def get_serializer_class(self):
+        """Lists render plain rows; everything else uses the model serializer."""
+        if self.action in ('list', 'my_responses'):
+            return ForumResponseListSerializer
+        return ForumResponseSerializer
+    
+    def get_serializer(self, *args, **kwargs):
+        """Give list rows the requesting user's votes on them, loaded in one query."""
+        if self.get_serializer_class() is ForumResponseListSerializer and self.request.user.is_authenticated:
+            rows = list(args[0])
+            kwargs['context'] = {
+                **self.get_serializer_context(),
+                'user_votes': dict(
+                    ResponseVote.objects.filter(
+                        user=self.request.user, response_id__in=[row['id'] for row in rows]
+                    ).values_list('response_id', 'vote_type')
+                ),
+            }
+            args = (rows, *args[1:])
+        return super().get_serializer(*args, **kwargs)
+    
+    def list(self, request, *args, **kwargs):
+        """
+        List responses.
+        
+        Anonymous reads of one thread's responses carry no per-user state,
+        so they are served from a cache that every write to the thread's
+        responses retires.
+        """
+        thread_id = request.query_params.get('thread')
+        if not thread_id or request.user.is_authenticated:
+            return super().list(request, *args, **kwargs)
+        
+        key = response_list_key(thread_id, request.build_absolute_uri())
+        payload = cache.get(key)
+        if payload is None:
+            payload = super().list(request, *args, **kwargs).data
+            cache.set(key, payload, RESPONSE_LIST_CACHE_TIMEOUT)
+        return Response(payload)
+    
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        invalidate_response_list(serializer.instance.thread_id)
+    
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        invalidate_response_list(serializer.instance.thread_id)
+    
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        invalidate_response_list(instance.thread_id)
     
     @action(detail=True, methods=['post'])
     def vote(self, request, pk=None):
@@ -219,25 +405,22 @@ class ForumResponseViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Get or create vote
-        vote, created = ResponseVote.objects.get_or_create(
-            response=response,
-            user=request.user,
-            defaults={'vote_type': vote_type}
-        )
+        # Vote and counter update commit together
+        with transaction.atomic():
+            created = ResponseVote.cast(response, request.user, vote_type)
         
-        # If vote exists and is different, update it
-        if not created and vote.vote_type != vote_type:
-            vote.vote_type = vote_type
-            vote.save()  # Signal will update counts automatically
+        invalidate_response_list(response.thread_id)
         
-        # Refresh response to get updated counts from signal
-        response.refresh_from_db()
+        # Refresh the trigger-updated counts; the annotated score is stale
+        response.refresh_from_db(fields=['helpful_count', 'unhelpful_count'])
+        del response.helpfulness_score_annotated
         
         return Response(
             {
                 'message': 'Vote recorded' if created else 'Vote updated',
-                'response': ForumResponseSerializer(response, context={'request': request}).data
+                'response': ForumResponseSerializer(
+                    response, context={'request': request, 'user_votes': {response.id: vote_type}}
+                ).data
             },
             status=status.HTTP_200_OK
         )
@@ -247,25 +430,31 @@ class ForumResponseViewSet(viewsets.ModelViewSet):
         """Remove vote from response."""
         response = self.get_object()
         
-        try:
-            vote = ResponseVote.objects.get(response=response, user=request.user)
-            vote.delete()  # Signal will update counts automatically
-            
-            # Refresh response to get updated counts
-            response.refresh_from_db()
-            
-            return Response(
-                {
-                    'message': 'Vote removed',
-                    'response': ForumResponseSerializer(response, context={'request': request}).data
-                },
-                status=status.HTTP_200_OK
-            )
-        except ResponseVote.DoesNotExist:
+        # A single DELETE; no signals or cascades, so no probing SELECT first
+        deleted, _ = ResponseVote.objects.filter(
+            response=response, user=request.user
+        ).delete()  # Trigger updates the counts
+        if not deleted:
             return Response(
                 {'error': 'Vote not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
+        
+        invalidate_response_list(response.thread_id)
+        
+        # Refresh the trigger-updated counts; the annotated score is stale
+        response.refresh_from_db(fields=['helpful_count', 'unhelpful_count'])
+        del response.helpfulness_score_annotated
+        
+        return Response(
+            {
+                'message': 'Vote removed',
+                'response': ForumResponseSerializer(
+                    response, context={'request': request, 'user_votes': {}}
+                ).data
+            },
+            status=status.HTTP_200_OK
+        )
     
     @action(detail=False, methods=['get'])
     def my_responses(self, request):
@@ -276,7 +465,8 @@ class ForumResponseViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        queryset = ForumResponse.objects.filter(author=request.user).select_related('author', 'thread')
+        # Shares the list's plain rows and single query for the user's votes
+        queryset = self.get_queryset().filter(author=request.user)
         page = self.paginate_queryset(queryset)
         
         if page is not None:
@@ -297,7 +487,9 @@ class ExpertVerificationViewSet(viewsets.ModelViewSet):
     - Manage expert profile
     """
     
-    queryset = ExpertVerification.objects.filter(status='approved')
+    queryset = ExpertVerification.objects.filter(
+        status='approved'
+    ).select_related('user').with_helpfulness_rate()
     serializer_class = ExpertVerificationSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     pagination_class = StandardResultsSetPagination
@@ -308,7 +500,8 @@ class ExpertVerificationViewSet(viewsets.ModelViewSet):
     
     def create(self, request, *args, **kwargs):
         """Request expert verification."""
-        if hasattr(request.user, 'expert_verification'):
+        # SELECT 1 instead of loading the request through the OneToOne descriptor
+        if ExpertVerification.objects.filter(user_id=request.user.id).exists():
             return Response(
                 {'error': 'You already have an expert verification request'},
                 status=status.HTTP_400_BAD_REQUEST
@@ -3,6 +3,23 @@ from django.utils.html import format_html
 from .models import ShopLocation
 
 
+BADGE_HTML = (
+    '<span style="background-color: {}; color: white; padding: 3px 10px; '
+    'border-radius: 3px; font-weight: bold;">{}</span>'
+)
+BADGE_COLORS = {
+    'pending': '#fbbf24',  # yellow
+    'approved': '#10b981',  # green
+    'rejected': '#ef4444',  # red
+}
+
+# Badges rendered once per status instead of once per changelist row
+APPROVAL_STATUS_BADGES = {
+    value: format_html(BADGE_HTML, BADGE_COLORS.get(value, '#6b7280'), label)
+    for value, label in ShopLocation.APPROVAL_STATUS_CHOICES
+}
+
+
 @admin.register(ShopLocation)
 class ShopLocationAdmin(admin.ModelAdmin):
     """Admin interface for managing shop locations."""
@@ -56,40 +73,28 @@ class ShopLocationAdmin(admin.ModelAdmin):
         """Display seller with link to their profile."""
         return format_html(
             '<a href="/admin/users/customuser/{}/change/">{}</a>',
-            obj.seller.id,
-            obj.seller.get_full_name() or obj.seller.email
+            obj.seller_id,
+            obj.seller_display_name
         )
     seller_link.short_description = 'Seller'
     
     def approval_status_badge(self, obj):
         """Display approval status with colored badge."""
-        colors = {
-            'pending': '#fbbf24',  # yellow
-            'approved': '#10b981',  # green
-            'rejected': '#ef4444',  # red
-        }
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 3px 10px; border-radius: 3px; font-weight: bold;">{}</span>',
-            colors.get(obj.approval_status, '#6b7280'),
-            obj.get_approval_status_display()
-        )
+        badge = APPROVAL_STATUS_BADGES.get(obj.approval_status)
+        if badge is None:
+            badge = format_html(BADGE_HTML, '#6b7280', obj.get_approval_status_display())
+        return badge
     approval_status_badge.short_description = 'Status'
     
     def approve_locations(self, request, queryset):
         """Approve selected locations."""
-        count = 0
-        for location in queryset.exclude(approval_status='approved'):
-            location.approve(request.user)
-            count += 1
+        count = queryset.approve(request.user)
         self.message_user(request, f'{count} location(s) approved successfully.')
     approve_locations.short_description = 'Approve selected locations'
     
     def reject_locations(self, request, queryset):
         """Reject selected locations."""
-        count = 0
-        for location in queryset.exclude(approval_status='rejected'):
-            location.reject(request.user, reason='Rejected via bulk action')
-            count += 1
+        count = queryset.reject(request.user, reason='Rejected via bulk action')
         self.message_user(request, f'{count} location(s) rejected.')
     reject_locations.short_description = 'Reject selected locations'
     
@@ -108,4 +113,5 @@ class ShopLocationAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         """Optimize queryset with select_related."""
         qs = super().get_queryset(request)
-        return qs.select_related('seller', 'store', 'approved_by')
+        # seller_link reads the denormalized name, so the seller isn't joined
+        return qs.select_related('store', 'approved_by')
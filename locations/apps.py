@@ -5,3 +5,6 @@ class LocationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'locations'
     verbose_name = 'Shop Locations'
+
+    def ready(self):
+        import locations.signals
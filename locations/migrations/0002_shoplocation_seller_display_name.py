@@ -0,0 +1,31 @@
+# Generated by Django 6.0 on 2026-10-16 14:10
+
+from django.db import migrations, models
+
+
+def backfill_seller_display_name(apps, schema_editor):
+    ShopLocation = apps.get_model('locations', 'ShopLocation')
+    CustomUser = apps.get_model('users', 'CustomUser')
+    sellers = CustomUser.objects.filter(
+        shop_locations__isnull=False
+    ).distinct().only('first_name', 'last_name', 'email')
+    for seller in sellers.iterator():
+        name = f"{seller.first_name} {seller.last_name}".strip() or seller.email
+        ShopLocation.objects.filter(seller=seller).update(seller_display_name=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locations', '0001_initial'),
+        ('users', '0006_customuser_verification_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='shoplocation',
+            name='seller_display_name',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.RunPython(backfill_seller_display_name, migrations.RunPython.noop),
+    ]
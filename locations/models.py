@@ -4,6 +4,36 @@ import uuid
 from users.models import CustomUser
 
 
+def display_name_for(user):
+    """Name shown for a seller: full name, or email when no name is set."""
+    return user.get_full_name() or user.email
+
+
+class ShopLocationQuerySet(models.QuerySet):
+    """QuerySet helpers for moderating locations in bulk."""
+    
+    def approve(self, admin_user):
+        """Approve every location not yet approved in one UPDATE; return the count."""
+        now = timezone.now()
+        return self.exclude(approval_status='approved').update(
+            approval_status='approved',
+            approved_at=now,
+            approved_by=admin_user,
+            updated_at=now
+        )
+    
+    def reject(self, admin_user, reason=None):
+        """Reject every location not yet rejected in one UPDATE; return the count."""
+        fields = {
+            'approval_status': 'rejected',
+            'approved_by': admin_user,
+            'updated_at': timezone.now(),
+        }
+        if reason:
+            fields['admin_notes'] = reason
+        return self.exclude(approval_status='rejected').update(**fields)
+
+
 class ShopLocation(models.Model):
     """
     Physical shop locations that appear on the map.
@@ -114,6 +144,12 @@ class ShopLocation(models.Model):
         related_name='approved_locations'
     )
     
+    # Copy of the seller's name for the admin changelist; kept in step by
+    # locations.signals when the seller is renamed
+    seller_display_name = models.CharField(max_length=255, blank=True, editable=False)
+    
+    objects = ShopLocationQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-created_at']
         indexes = [
@@ -127,6 +163,30 @@ class ShopLocation(models.Model):
     def __str__(self):
         return f"{self.name} ({self.get_location_type_display()})"
     
+    # seller_id as last loaded from/saved to the database
+    _saved_seller_id = None
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if 'seller_id' in field_names:
+            instance._saved_seller_id = instance.seller_id
+        return instance
+    
+    def save(self, *args, **kwargs):
+        """Save the location, refreshing the seller's display name when it can change."""
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            # Renames are pushed by the seller's post_save signal, so only a
+            # new or reassigned seller needs the name looked up here
+            refresh = self._state.adding or self.seller_id != self._saved_seller_id
+        else:
+            refresh = 'seller_display_name' in update_fields
+        if refresh:
+            self.seller_display_name = display_name_for(self.seller)
+        super().save(*args, **kwargs)
+        self._saved_seller_id = self.seller_id
+    
     def approve(self, admin_user):
         """Approve the location."""
         self.approval_status = 'approved'
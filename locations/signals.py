@@ -0,0 +1,18 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from users.models import CustomUser
+from .models import ShopLocation, display_name_for
+
+
+NAME_FIELDS = {'first_name', 'last_name', 'email'}
+
+
+@receiver(post_save, sender=CustomUser)
+def sync_seller_display_name(sender, instance, created, update_fields=None, **kwargs):
+    """Copy a renamed user's display name onto their shop locations."""
+    if created or (update_fields is not None and not NAME_FIELDS.intersection(update_fields)):
+        return
+    name = display_name_for(instance)
+    ShopLocation.objects.filter(seller=instance).exclude(
+        seller_display_name=name
+    ).update(seller_display_name=name)
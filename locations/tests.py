@@ -182,3 +182,52 @@ class ShopLocationModelTest(TestCase):
         )
         
         self.assertEqual(ShopLocation.objects.filter(seller=self.seller).count(), 3)
+
+    def test_bulk_approve_and_reject(self):
+        """Test approving and rejecting locations through the queryset helpers"""
+        pending = ShopLocation.objects.create(
+            seller=self.seller, name="Pending", latitude=Decimal("23.0"),
+            longitude=Decimal("90.0"), city="Dhaka"
+        )
+        approved = ShopLocation.objects.create(
+            seller=self.seller, name="Approved", latitude=Decimal("23.1"),
+            longitude=Decimal("90.1"), city="Dhaka", approval_status="approved"
+        )
+        
+        self.assertEqual(ShopLocation.objects.all().approve(self.seller), 1)
+        pending.refresh_from_db()
+        self.assertEqual(pending.approval_status, "approved")
+        self.assertEqual(pending.approved_by, self.seller)
+        self.assertIsNotNone(pending.approved_at)
+        
+        self.assertEqual(ShopLocation.objects.filter(id=approved.id).reject(self.seller, reason="Closed"), 1)
+        approved.refresh_from_db()
+        self.assertEqual(approved.approval_status, "rejected")
+        self.assertEqual(approved.admin_notes, "Closed")
+
+    def test_seller_display_name_follows_seller(self):
+        """Test that the denormalized seller name is set on save and on rename"""
+        location = ShopLocation.objects.create(
+            seller=self.seller, name="Named", latitude=Decimal("23.0"),
+            longitude=Decimal("90.0"), city="Dhaka"
+        )
+        self.assertEqual(location.seller_display_name, "Shop Owner")
+        
+        self.seller.first_name = "Corner"
+        self.seller.save()
+        location.refresh_from_db()
+        self.assertEqual(location.seller_display_name, "Corner Owner")
+
+    def test_save_skips_seller_lookup_when_seller_unchanged(self):
+        """Test that saving without a seller change does not load the seller"""
+        location = ShopLocation.objects.create(
+            seller=self.seller, name="Quiet", latitude=Decimal("23.0"),
+            longitude=Decimal("90.0"), city="Dhaka"
+        )
+        location = ShopLocation.objects.get(id=location.id)
+        
+        with self.assertNumQueries(1):
+            location.approve(self.seller)
+        with self.assertNumQueries(1):
+            location.save(update_fields=['name'])
+        self.assertEqual(location.seller_display_name, "Shop Owner")
@@ -0,0 +1,7 @@
+from rest_framework.routers import SimpleRouter
+from locations.views import ShopLocationViewSet
+
+router = SimpleRouter()
+router.register(r'shop-locations', ShopLocationViewSet, basename='shop-location')
+
+urlpatterns = router.urls
@@ -77,6 +77,22 @@ class Conversation(models.Model):
         self.save(update_fields=['last_message_at'])
 
 
+class MessageQuerySet(models.QuerySet):
+    """QuerySet helpers for read receipts."""
+    
+    def mark_as_read(self, user):
+        """Mark every message as read by a user in one INSERT; return how many were attempted."""
+        ReadBy = self.model.read_by.through
+        unread_ids = list(self.exclude(read_by=user).values_list('id', flat=True))
+        # ignore_conflicts covers receipts added since the unread ids were read,
+        # and bulk_create then returns every object, so count the ids instead
+        ReadBy.objects.bulk_create(
+            [ReadBy(message_id=message_id, customuser_id=user.id) for message_id in unread_ids],
+            ignore_conflicts=True
+        )
+        return len(unread_ids)
+
+
 class Message(models.Model):
     """
     Individual message in a conversation.
@@ -112,6 +128,8 @@ class Message(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = MessageQuerySet.as_manager()
+    
     class Meta:
         ordering = ['created_at']
         indexes = [
@@ -124,8 +142,8 @@ class Message(models.Model):
     
     def mark_as_read(self, user):
         """Mark message as read by a user."""
-        if not self.read_by.filter(id=user.id).exists():
-            self.read_by.add(user)
+        # add() skips existing rows itself
+        self.read_by.add(user)
     
     def get_read_count(self):
         """Get number of users who have read this message."""
@@ -107,6 +107,16 @@ class MessageModelTest(TestCase):
         self.assertEqual(message.read_by.count(), 1)
         self.assertIn(self.receiver, message.read_by.all())
 
+    def test_mark_messages_read_in_bulk(self):
+        """Test marking a conversation's messages read skips ones already read"""
+        first = Message.objects.create(conversation=self.conversation, sender=self.sender, content="One")
+        Message.objects.create(conversation=self.conversation, sender=self.sender, content="Two")
+        first.read_by.add(self.receiver)
+        
+        self.assertEqual(self.conversation.messages.all().mark_as_read(self.receiver), 1)
+        self.assertEqual(self.receiver.read_messages.count(), 2)
+        self.assertEqual(self.conversation.messages.all().mark_as_read(self.receiver), 0)
+
 
 class MessageAttachmentModelTest(TestCase):
     """Test suite for MessageAttachment model"""
@@ -0,0 +1,9 @@
+from rest_framework.routers import SimpleRouter
+from messaging.views import ConversationViewSet, MessageViewSet, BlockedUserViewSet
+
+router = SimpleRouter()
+router.register(r'conversations', ConversationViewSet, basename='conversation')
+router.register(r'messages', MessageViewSet, basename='message')
+router.register(r'blocked-users', BlockedUserViewSet, basename='blocked-user')
+
+urlpatterns = router.urls
@@ -102,8 +102,7 @@ class ConversationViewSet(viewsets.ModelViewSet):
             )
         
         # Mark all messages as read
-        for message in conversation.messages.all():
-            message.mark_as_read(request.user)
+        conversation.messages.all().mark_as_read(request.user)
         
         # Update participant data
         participant = ConversationParticipant.objects.get(
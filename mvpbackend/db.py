@@ -0,0 +1,25 @@
+from django.db import connections, router
+
+
+def insert_unless_exists(model, values):
+    """
+    Insert one row unless it breaks a unique constraint; return whether it did.
+    
+    values maps field names to Python values. A single INSERT ... ON CONFLICT
+    DO NOTHING RETURNING replaces get_or_create's SELECT, INSERT and
+    savepoint. Runs on PostgreSQL and on SQLite 3.35+.
+    """
+    opts = model._meta
+    connection = connections[router.db_for_write(model)]
+    quote = connection.ops.quote_name
+    fields = [opts.get_field(name) for name in values]
+    params = [field.get_db_prep_save(values[field.name], connection) for field in fields]
+    sql = 'INSERT INTO %s (%s) VALUES (%s) ON CONFLICT DO NOTHING RETURNING %s' % (
+        quote(opts.db_table),
+        ', '.join(quote(field.column) for field in fields),
+        ', '.join(['%s'] * len(fields)),
+        quote(opts.pk.column),
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchone() is not None
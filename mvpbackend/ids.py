@@ -0,0 +1,17 @@
+import os
+import time
+import uuid
+
+
+def uuid7():
+    """
+    Return a time-ordered UUID (version 7, RFC 9562).
+    
+    The leading 48 bits are the Unix time in milliseconds, so new keys land
+    at the right edge of the primary key index instead of at random pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
@@ -0,0 +1,84 @@
+from django.core.cache import cache
+from django.core.paginator import Page, Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+from functools import partial
+import hashlib
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that shares the total count through the cache."""
+    
+    def __init__(self, *args, count_cache_key=None, refresh_count=False, count_cache_timeout=300, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_cache_key = count_cache_key
+        self.refresh_count = refresh_count
+        self.count_cache_timeout = count_cache_timeout
+    
+    @cached_property
+    def count(self):
+        if self.count_cache_key is None:
+            return super().count
+        count = None if self.refresh_count else cache.get(self.count_cache_key)
+        if count is None:
+            count = super().count
+            cache.set(self.count_cache_key, count, self.count_cache_timeout)
+        return count
+
+
+class FastCountPagination(PageNumberPagination):
+    """
+    Page number pagination that skips COUNT(*) when the first page is short.
+    
+    The first page is read with one extra row. When everything fits on the
+    page the total is the number of rows read; otherwise COUNT(*) runs for
+    the page links as before. Later pages paginate normally.
+    """
+    
+    def paginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        if not page_size or request.query_params.get(self.page_query_param, '1') != '1':
+            return super().paginate_queryset(queryset, request, view)
+        
+        rows = list(queryset[:page_size + 1])
+        if len(rows) <= page_size:
+            paginator = self.django_paginator_class(rows, page_size)
+        else:
+            paginator = self.django_paginator_class(queryset, page_size)
+        
+        self.request = request
+        self.page = Page(rows[:page_size], 1, paginator)
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        return list(self.page)
+
+
+class CachedCountPagination(FastCountPagination):
+    """
+    Pagination that caches COUNT(*) across the pages of one listing.
+    
+    The first page always recounts so landing totals stay fresh; later pages
+    of the same filters reuse that count for five minutes.
+    """
+    count_cache_timeout = 300
+    count_cache_prefix = 'pagecount'
+    
+    def paginate_queryset(self, queryset, request, view=None):
+        page_number = request.query_params.get(self.page_query_param, '1')
+        self.django_paginator_class = partial(
+            CachedCountPaginator,
+            count_cache_key=self.get_count_cache_key(request),
+            refresh_count=page_number == '1',
+            count_cache_timeout=self.count_cache_timeout
+        )
+        return super().paginate_queryset(queryset, request, view)
+    
+    def get_count_cache_key(self, request):
+        """Build a cache key from the path, filters and viewer, ignoring paging."""
+        params = sorted(
+            (key, value) for key, value in request.query_params.lists()
+            if key not in (self.page_query_param, self.page_size_query_param)
+        )
+        viewer = request.user.pk if request.user.is_authenticated else 'anon'
+        raw = f"{request.path}|{params}|{viewer}"
+        return f"{self.count_cache_prefix}:{hashlib.md5(raw.encode()).hexdigest()}"
@@ -53,6 +53,7 @@ INSTALLED_APPS = [
 
     # Third party
     'rest_framework',
+    'django_filters',
 ]
 
 # ==============================
@@ -104,13 +105,40 @@ WSGI_APPLICATION = 'mvpbackend.wsgi.application'
 # ==============================
 # Database
 # ==============================
+# Keep connections open between requests instead of reconnecting each time;
+# health checks drop connections that went away while idle.
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
+        # Required behind a transaction-pooling PgBouncer, where a named
+        # cursor can outlive the server connection it was opened on
+        'DISABLE_SERVER_SIDE_CURSORS': os.environ.get('DB_TRANSACTION_POOLING', 'False') == 'True',
     }
 }
 
+# ==============================
+# Cache
+# ==============================
+# Set REDIS_URL to share cached payloads between workers; each process
+# keeps its own in-memory cache otherwise.
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # ==============================
 # Authentication
 # ==============================
@@ -131,6 +159,9 @@ REST_FRAMEWORK = {
         'rest_framework_simplejwt.authentication.JWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
+    'DEFAULT_THROTTLE_RATES': {
+        'likes': os.environ.get('LIKE_THROTTLE_RATE', '30/min'),
+    },
 }
 
 SIMPLE_JWT = {
@@ -174,6 +205,14 @@ STATIC_URL = 'static/'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Threads shared by all requests for writing uploaded car images to storage
+CAR_IMAGE_UPLOAD_WORKERS = int(os.environ.get('CAR_IMAGE_UPLOAD_WORKERS', '8'))
+
+# Forum thread views are buffered in the cache and written in batches of this size.
+# Only buffer with a shared cache: the in-memory cache is per process and evicts
+# entries, which would drop views still waiting for a full batch.
+FORUM_VIEW_FLUSH_EVERY = int(os.environ.get('FORUM_VIEW_FLUSH_EVERY', '10' if REDIS_URL else '1'))
+
 # ==============================
 # SSLCommerz Payment Gateway
 # ==============================
@@ -0,0 +1,12 @@
+"""
+Settings for running the test suite.
+
+Usage: python manage.py test --settings=mvpbackend.settings_test
+"""
+
+from .settings import *  # noqa: F401,F403
+
+# Test fixtures create many users; PBKDF2 would dominate the run time
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
@@ -0,0 +1,8 @@
+from rest_framework.routers import SimpleRouter
+from notifications.views import NotificationViewSet, NotificationPreferenceViewSet
+
+router = SimpleRouter()
+router.register(r'notifications', NotificationViewSet, basename='notification')
+router.register(r'notification-preferences', NotificationPreferenceViewSet, basename='notification-preference')
+
+urlpatterns = router.urls
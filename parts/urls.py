@@ -0,0 +1,10 @@
+from rest_framework.routers import SimpleRouter
+from parts.views import CarPartViewSet, PartCategoryViewSet, CompanyStoreViewSet, PartReviewViewSet
+
+router = SimpleRouter()
+router.register(r'parts', CarPartViewSet, basename='part')
+router.register(r'part-categories', PartCategoryViewSet, basename='part-category')
+router.register(r'company-stores', CompanyStoreViewSet, basename='company-store')
+router.register(r'part-reviews', PartReviewViewSet, basename='part-review')
+
+urlpatterns = router.urls
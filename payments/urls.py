@@ -0,0 +1,12 @@
+from rest_framework.routers import SimpleRouter
+from payments.views import OrderViewSet, PaymentViewSet, InvoiceViewSet, RefundViewSet, WalletViewSet, DiscountViewSet
+
+router = SimpleRouter()
+router.register(r'orders', OrderViewSet, basename='order')
+router.register(r'payments', PaymentViewSet, basename='payment')
+router.register(r'invoices', InvoiceViewSet, basename='invoice')
+router.register(r'refunds', RefundViewSet, basename='refund')
+router.register(r'wallets', WalletViewSet, basename='wallet')
+router.register(r'discounts', DiscountViewSet, basename='discount')
+
+urlpatterns = router.urls
@@ -0,0 +1,8 @@
+from rest_framework.routers import SimpleRouter
+from ratings.views import ReviewViewSet, SellerRatingViewSet
+
+router = SimpleRouter()
+router.register(r'reviews', ReviewViewSet, basename='review')
+router.register(r'seller-ratings', SellerRatingViewSet, basename='seller-rating')
+
+urlpatterns = router.urls
@@ -13,6 +13,9 @@ import subprocess
 import re
 from datetime import datetime
 
+# Test settings swap in a fast password hasher
+TEST_SETTINGS = '--settings=mvpbackend.settings_test'
+
 def run_all_tests():
     """Run all tests in the project"""
     print("\n" + "=" * 80)
@@ -46,7 +49,7 @@ def run_all_tests():
         
         # Run tests with verbose output to show individual test names
         result = subprocess.run(
-            [sys.executable, 'manage.py', 'test', app, '-v', '2'],
+            [sys.executable, 'manage.py', 'test', app, '-v', '2', TEST_SETTINGS],
             capture_output=True,
             text=True
         )
@@ -91,7 +94,7 @@ def run_all_tests():
     print(f"{'='*80}")
     
     result = subprocess.run(
-        [sys.executable, 'manage.py', 'test', 'integration_tests', '-v', '2'],
+        [sys.executable, 'manage.py', 'test', 'integration_tests', '-v', '2', TEST_SETTINGS],
         capture_output=True,
         text=True
     )
@@ -164,7 +167,7 @@ def run_all_tests():
 def run_app_tests(app_name):
     """Run tests for a specific app"""
     print(f"Running tests for {app_name}...")
-    result = subprocess.run([sys.executable, 'manage.py', 'test', app_name])
+    result = subprocess.run([sys.executable, 'manage.py', 'test', app_name, TEST_SETTINGS])
     sys.exit(result.returncode)
 
 
@@ -180,7 +183,7 @@ def run_with_coverage():
         subprocess.run([sys.executable, '-m', 'pip', 'install', 'coverage'])
     
     # Run coverage
-    subprocess.run([sys.executable, '-m', 'coverage', 'run', '--source=.', 'manage.py', 'test'])
+    subprocess.run([sys.executable, '-m', 'coverage', 'run', '--source=.', 'manage.py', 'test', TEST_SETTINGS])
     subprocess.run([sys.executable, '-m', 'coverage', 'report'])
     subprocess.run([sys.executable, '-m', 'coverage', 'html'])
     print("\nHTML coverage report generated in htmlcov/index.html")
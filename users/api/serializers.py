@@ -1,7 +1,7 @@
 from rest_framework import serializers
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
-from users.models import CustomUser
+from users.models import CustomUser, USER_LIST_COLUMNS
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -172,4 +172,44 @@ class UserListSerializer(serializers.ModelSerializer):
     
     def get_full_name(self, obj):
         """Return user's full name."""
-        return obj.get_full_name()
\ No newline at end of file
+        return obj.get_full_name()
+
+
+class UserListRowSerializer(serializers.Serializer):
+    """
+    Read-only serializer rendering UserListSerializer's output from a
+    values() row that carries USER_LIST_COLUMNS under a prefix such as
+    'seller__', so list views can embed users without model instances.
+    """
+    
+    def __init__(self, *args, prefix='', **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prefix = prefix
+        # Built once and reused for every row
+        self.seller_rating_field = serializers.DecimalField(max_digits=3, decimal_places=2)
+        self.datetime_field = serializers.DateTimeField()
+        self.profile_picture_storage = CustomUser._meta.get_field('profile_picture').storage
+    
+    def get_profile_picture(self, name):
+        """Build the picture URL the way DRF's ImageField does."""
+        if not name:
+            return None
+        url = self.profile_picture_storage.url(name)
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+    
+    def to_representation(self, row):
+        user = {name: row[f'{self.prefix}{name}'] for name in USER_LIST_COLUMNS}
+        return {
+            'id': str(user['id']),
+            'email': user['email'],
+            'full_name': f"{user['first_name']} {user['last_name']}".strip(),
+            'profile_picture': self.get_profile_picture(user['profile_picture']),
+            'user_type': user['user_type'],
+            'company_name': user['company_name'],
+            'is_seller': user['is_seller'],
+            'seller_rating': self.seller_rating_field.to_representation(user['seller_rating']),
+            'seller_reviews_count': user['seller_reviews_count'],
+            'verification_status': user['verification_status'],
+            'date_joined': self.datetime_field.to_representation(user['date_joined']),
+        }
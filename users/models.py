@@ -186,3 +186,12 @@ class CustomUser(AbstractUser):
         """Update the last login timestamp."""
         self.last_login = timezone.now()
         self.save(update_fields=['last_login'])
+
+
+# User columns read by UserListSerializer, for only() and values() on
+# querysets that render related users
+USER_LIST_COLUMNS = (
+    'id', 'email', 'first_name', 'last_name', 'profile_picture', 'user_type',
+    'company_name', 'is_seller', 'seller_rating', 'seller_reviews_count',
+    'verification_status', 'date_joined'
+)